@@ -479,12 +479,10 @@ class Backend(GridObjects, ABC):
         if not self._can_be_copied:
             raise BackendError("This backend cannot be copied.")
 
-        start_grid = self._grid
-        self._grid = None
+        # the grid is copied along with the other attributes, so that a backend keeping
+        # references to some parts of its grid (eg numpy arrays) can update them when unpickled
         res = copy.deepcopy(self)
         res.__class__ = type(self)  # somehow deepcopy forget the init class... weird
-        res._grid = copy.deepcopy(start_grid)
-        self._grid = start_grid
         res._is_loaded = False  # i can reload a copy of an environment
         return res
 
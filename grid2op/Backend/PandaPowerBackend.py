@@ -9,7 +9,9 @@
 import os  # load the python os default module
 import sys  # laod the python sys default module
 import copy
+import pickle
 import warnings
+from multiprocessing import Pool
 
 import numpy as np
 import pandas as pd
@@ -33,6 +35,158 @@ except (ImportError, ModuleNotFoundError):
         "\n\t{} -m pip install numba\n".format(sys.executable)
     )
 
+# Conversion of grid2op buses (-1, 1 or 2) into pandapower buses, used when applying a topology.
+# `_translate_bus` returns the pandapower bus of each element knowing the pandapower bus `init_bus`
+# of this element when on bus 1 (`_INVALID_BUS` is returned for buses that are not -1, 1 or 2).
+# `_apply_topo_scatter` does the same and writes the result directly in the columns `out_bus`
+# and `out_in_service` of the grid. The bus of a disconnected element is set to -1 only if
+# `set_bus_disconnected` is True. It returns False (and the columns might have been partially
+# modified) if an invalid bus is encountered.
+_INVALID_BUS = -2
+
+
+def _translate_bus_loop(new_bus, init_bus, nb_bus_before):
+    res = np.empty(new_bus.shape[0], dtype=dt_int)
+    for i in range(new_bus.shape[0]):
+        if new_bus[i] == 1:
+            res[i] = init_bus[i]
+        elif new_bus[i] == 2:
+            res[i] = init_bus[i] + nb_bus_before
+        elif new_bus[i] == -1:
+            res[i] = -1
+        else:
+            res[i] = _INVALID_BUS
+    return res
+
+
+def _apply_topo_scatter_loop(
+    new_bus,
+    id_init,
+    id_out,
+    init_bus,
+    nb_bus_before,
+    out_bus,
+    out_in_service,
+    set_bus_disconnected,
+):
+    for i in range(new_bus.shape[0]):
+        if new_bus[i] == 1:
+            out_bus[id_out[i]] = init_bus[id_init[i]]
+            out_in_service[id_out[i]] = True
+        elif new_bus[i] == 2:
+            out_bus[id_out[i]] = init_bus[id_init[i]] + nb_bus_before
+            out_in_service[id_out[i]] = True
+        elif new_bus[i] == -1:
+            out_in_service[id_out[i]] = False
+            if set_bus_disconnected:
+                out_bus[id_out[i]] = -1
+        else:
+            return False
+    return True
+
+
+def _translate_bus_numpy(new_bus, init_bus, nb_bus_before):
+    res = np.full(new_bus.shape, fill_value=_INVALID_BUS, dtype=dt_int)
+    res[new_bus == -1] = -1
+    is_bus1 = new_bus == 1
+    res[is_bus1] = init_bus[is_bus1]
+    is_bus2 = new_bus == 2
+    res[is_bus2] = init_bus[is_bus2] + nb_bus_before
+    return res
+
+
+def _apply_topo_scatter_numpy(
+    new_bus,
+    id_init,
+    id_out,
+    init_bus,
+    nb_bus_before,
+    out_bus,
+    out_in_service,
+    set_bus_disconnected,
+):
+    new_bus_backend = _translate_bus_numpy(new_bus, init_bus[id_init], nb_bus_before)
+    if np.any(new_bus_backend == _INVALID_BUS):
+        return False
+    connected = new_bus_backend >= 0
+    out_in_service[id_out] = connected
+    if set_bus_disconnected:
+        out_bus[id_out] = new_bus_backend
+    else:
+        out_bus[id_out[connected]] = new_bus_backend[connected]
+    return True
+
+
+# Post processing of the flows of one side of the powerlines, done in place after a powerflow:
+# `v` is converted from pu to kV and non finite values are set to 0. (as well as the voltage of
+# disconnected powerlines, not taken into account by pandapower). `a` is already in A.
+def _clean_flows_loop(a, v, line_status, v_pu_to_kv):
+    for i in range(a.shape[0]):
+        if not np.isfinite(a[i]):
+            a[i] = 0.0
+        if line_status[i] and np.isfinite(v[i]):
+            v[i] *= v_pu_to_kv[i]
+        else:
+            v[i] = 0.0
+
+
+def _clean_flows_numpy(a, v, line_status, v_pu_to_kv):
+    np.nan_to_num(a, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+    v *= v_pu_to_kv
+    v *= line_status  # nan stay nan, they are set to 0. just below
+    np.nan_to_num(v, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+# Fill the topology vector `res` (at positions `pos`) for the elements of one type: 1 if the element is
+# connected to the bus `subid` of its substation, 2 otherwise, and -1 if its `status` is False
+# (`status` is None for the elements that are always considered connected).
+def _fill_topo_vect_loop(bus, subid, pos, status, res):
+    # 2 - (bus == subid) is 1 if the element is on the bus `subid`, 2 otherwise
+    if status is None:
+        for i in range(bus.shape[0]):
+            res[pos[i]] = 2 - (bus[i] == subid[i])
+    else:
+        for i in range(bus.shape[0]):
+            res[pos[i]] = 2 - (bus[i] == subid[i]) if status[i] else -1
+
+
+def _fill_topo_vect_numpy(bus, subid, pos, status, res):
+    # 2 - (bus == subid) is 1 if the element is on the bus `subid`, 2 otherwise
+    code = 2 - (bus == subid)
+    if status is not None:
+        code = np.where(status, code, -1)
+    res[pos] = code
+
+
+# The "loop" versions are compiled with numba when it is available, otherwise the "numpy" versions are
+# used (the loops are really slow in pure python). Both are kept to be tested one against the other.
+if numba_:
+    _translate_bus = numba.njit(cache=True, fastmath=False)(_translate_bus_loop)
+    _apply_topo_scatter = numba.njit(cache=True, fastmath=False)(_apply_topo_scatter_loop)
+    _clean_flows = numba.njit(cache=True, fastmath=False)(_clean_flows_loop)
+    _fill_topo_vect = numba.njit(cache=True, fastmath=False)(_fill_topo_vect_loop)
+else:
+    _translate_bus = _translate_bus_numpy
+    _apply_topo_scatter = _apply_topo_scatter_numpy
+    _clean_flows = _clean_flows_numpy
+    _fill_topo_vect = _fill_topo_vect_numpy
+
+
+# workers of PandaPowerBackend.runpf_batch: each process receives the (pickled) backend only once, when it is
+# started, and then re uses it for all the scenarios it is given
+_BATCH_WORKER = None  # (backend, initial state) of the process
+
+
+def _aux_batch_init(backend_bytes):
+    global _BATCH_WORKER
+    backend = pickle.loads(backend_bytes)
+    _BATCH_WORKER = (backend, backend._aux_get_batch_state())
+
+
+def _aux_batch_runpf(args):
+    backend, init_state = _BATCH_WORKER
+    return backend._aux_runpf_injections(init_state, *args)
+
 
 class PandaPowerBackend(Backend):
     """
@@ -92,6 +246,13 @@ class PandaPowerBackend(Backend):
     v_ex: :class:`numpy.array`, dtype:float
         The voltage magnitude at the extremity bus of the powerline
 
+    Notes
+    -----
+    :func:`PandaPowerBackend.get_line_status`, :func:`PandaPowerBackend.get_line_flow` and
+    :func:`PandaPowerBackend.get_topo_vect` do not copy anything: they return read-only views on the
+    buffers of the backend, which are updated at each powerflow. Copy them if you need to keep
+    (or modify) their values.
+
     Examples
     ---------
     The only recommended way to use this class is by passing an instance of a Backend into the "make"
@@ -108,6 +269,56 @@ class PandaPowerBackend(Backend):
 
     """
 
+    # name of the result vectors stored in `_res_buf`, by type of element
+    _res_line_attr = (
+        "p_or",
+        "q_or",
+        "v_or",
+        "a_or",
+        "theta_or",
+        "p_ex",
+        "q_ex",
+        "v_ex",
+        "a_ex",
+        "theta_ex",
+    )
+    _res_load_attr = ("load_p", "load_q", "load_v", "load_theta")
+    _res_gen_attr = ("prod_p", "prod_q", "prod_v", "gen_theta")
+    _res_storage_attr = ("storage_p", "storage_q", "storage_v", "storage_theta")
+    # columns of the grid cached as numpy arrays, see _aux_cache_grid_arrays: (attribute, table, column)
+    _cached_grid_cols = (
+        ("_load_p_arr", "load", "p_mw"),
+        ("_load_q_arr", "load", "q_mvar"),
+        ("_load_bus_arr", "load", "bus"),
+        ("_load_in_service_arr", "load", "in_service"),
+        ("_gen_p_arr", "gen", "p_mw"),
+        ("_gen_vm_arr", "gen", "vm_pu"),
+        ("_gen_bus_arr", "gen", "bus"),
+        ("_gen_in_service_arr", "gen", "in_service"),
+        ("_line_from_bus_arr", "line", "from_bus"),
+        ("_line_to_bus_arr", "line", "to_bus"),
+        ("_line_in_service_arr", "line", "in_service"),
+        ("_trafo_hv_bus_arr", "trafo", "hv_bus"),
+        ("_trafo_lv_bus_arr", "trafo", "lv_bus"),
+        ("_trafo_in_service_arr", "trafo", "in_service"),
+        ("_bus_in_service_arr", "bus", "in_service"),
+        ("_bus_vn_kv_arr", "bus", "vn_kv"),
+        ("_ext_grid_bus_arr", "ext_grid", "bus"),
+        ("_storage_p_arr", "storage", "p_mw"),
+        ("_storage_bus_arr", "storage", "bus"),
+        ("_storage_in_service_arr", "storage", "in_service"),
+        ("_shunt_p_arr", "shunt", "p_mw"),
+        ("_shunt_q_arr", "shunt", "q_mvar"),
+        ("_shunt_bus_arr", "shunt", "bus"),
+        ("_shunt_in_service_arr", "shunt", "in_service"),
+    )
+    # cached columns (all but the injections) used by pandapower to build its internal structures
+    _ybus_cached_attr = tuple(
+        el[0]
+        for el in _cached_grid_cols
+        if el[0] not in ("_load_p_arr", "_load_q_arr", "_gen_p_arr", "_gen_vm_arr", "_storage_p_arr")
+    )
+
     def __init__(
         self,
         detailed_infos_for_cascading_failures=False,
@@ -115,6 +326,9 @@ class PandaPowerBackend(Backend):
         dist_slack=False,
         max_iter=10,
         can_be_copied=True,
+        use_umfpack=True,  # solve the linear systems with umfpack (if installed, otherwise SuperLU is used)
+        permc_spec=None,  # column permutation used by SuperLU (None: scipy default)
+        recycle=False,  # reuse the admittance matrix of the previous powerflow when the topology has not changed
     ):
         Backend.__init__(
             self,
@@ -122,14 +336,24 @@ class PandaPowerBackend(Backend):
             can_be_copied=can_be_copied,
             ligthsim2grid=ligthsim2grid,
             dist_slack=dist_slack,
-            max_iter=max_iter
+            max_iter=max_iter,
         )
+        # the solver options are kept (to re create the backend, eg in the runner) only when they are not
+        # the default ones: the classes inheriting from this one do not necessarily accept them
+        for nm_, val_, default_ in (
+            ("use_umfpack", use_umfpack, True),
+            ("permc_spec", permc_spec, None),
+            ("recycle", recycle, False),
+        ):
+            if val_ != default_:
+                self._my_kwargs[nm_] = val_
         self.prod_pu_to_kv = None
         self.load_pu_to_kv = None
         self.lines_or_pu_to_kv = None
         self.lines_ex_pu_to_kv = None
         self.storage_pu_to_kv = None
 
+        self._res_buf = None
         self.p_or = None
         self.q_or = None
         self.v_or = None
@@ -152,24 +376,30 @@ class PandaPowerBackend(Backend):
         self.prod_v = None
         self.line_status = None
 
-        self._pf_init = "flat"
-        self._pf_init = "results"
-        self._nb_bus_before = None  # number of active bus at the preceeding step
+        self._pf_init = "dc"  # initialisation of the ac powerflows (see runpf)
 
         self.thermal_limit_a = None
 
         self._iref_slack = None
         self._id_bus_added = None
         self._fact_mult_gen = -1
-        self._what_object_where = None
         self._number_true_line = -1
         self._corresp_name_fun = {}
-        self._get_vector_inj = {}
         self.dim_topo = -1
         self._vars_action = BaseAction.attr_list_vect
         self._vars_action_set = BaseAction.attr_list_vect
         self.cst_1 = dt_float(1.0)
         self._topo_vect = None
+        self._initial_topo_vect = None  # topology of the grid as loaded, to facilitate the "reset"
+        self._topo_dirty = True  # whether the topology has been modified since _topo_vect was last computed
+        # whether the topology (or the shunts) has been modified since the last (successful) ac powerflow, in
+        # which case pandapower needs to rebuild its internal structures (including the admittance matrix)
+        self._ybus_dirty = True
+        self._ybus_signature = None  # content of the columns in _ybus_cached_attr at the last ac powerflow
+        # read only views on line_status, a_or and _topo_vect (returned by the getters)
+        self._ro_line_status = None
+        self._ro_a_or = None
+        self._ro_topo_vect = None
         self.slack_id = None
 
         # function to rstore some information
@@ -181,10 +411,41 @@ class PandaPowerBackend(Backend):
         self._init_bus_gen = None
         self._init_bus_lor = None
         self._init_bus_lex = None
-        self._get_vector_inj = None
-        self._big_topo_to_obj = None
-        self._big_topo_to_backend = None
-        self.__pp_backend_initial_grid = None  # initial state to facilitate the "reset"
+        self._bt2b_id_backend = None
+        self._bt2b_id_topo = None
+        self._bt2b_type = None
+        self._active_bus_pos = None
+        # all the (load, generator) pairs connected to the same substation, sorted by load then generator
+        self._load_gen_pair_load = None
+        self._load_gen_pair_gen = None
+        self._grid_snapshot = None  # initial state to facilitate the "reset"
+
+        # numpy arrays in which pandapower stores some columns of the grid (see _aux_cache_grid_arrays)
+        self._load_p_arr = None
+        self._load_q_arr = None
+        self._load_bus_arr = None
+        self._load_in_service_arr = None
+        self._gen_p_arr = None
+        self._gen_vm_arr = None
+        self._gen_bus_arr = None
+        self._gen_in_service_arr = None
+        self._storage_p_arr = None
+        self._storage_bus_arr = None
+        self._storage_in_service_arr = None
+        self._shunt_p_arr = None
+        self._shunt_q_arr = None
+        self._shunt_bus_arr = None
+        self._shunt_in_service_arr = None
+        self._line_from_bus_arr = None
+        self._line_to_bus_arr = None
+        self._line_in_service_arr = None
+        self._trafo_hv_bus_arr = None
+        self._trafo_lv_bus_arr = None
+        self._trafo_in_service_arr = None
+        self._bus_in_service_arr = None
+        self._bus_vn_kv_arr = None
+        self._ext_grid_bus_arr = None
+        self._reset_inplace = True  # if False, the tables are rebuilt at each "reset" (slower, kept for testing)
 
         # Mapping some fun to apply bus updates
         self._type_to_bus_set = [
@@ -195,6 +456,8 @@ class PandaPowerBackend(Backend):
             self._apply_lex_bus,
             self._apply_trafo_lv,
         ]
+        # name of the objects of each of these types (see `_convert_id_topo`)
+        self._bt2o_names = ("load", "gen", "lineor", "lineor", "lineex", "lineex")
 
         self.tol = None  # this is NOT the pandapower tolerance !!!! this is used to check if a storage unit
         # produce / absorbs anything
@@ -210,6 +473,9 @@ class PandaPowerBackend(Backend):
         self._ligthsim2grid = ligthsim2grid
         self._dist_slack = dist_slack
         self._max_iter = max_iter
+        self._use_umfpack = use_umfpack
+        self._permc_spec = permc_spec
+        self._recycle = recycle
 
     def _check_for_non_modeled_elements(self):
         """This function check for elements in the pandapower grid that will have no impact on grid2op.
@@ -254,11 +520,11 @@ class PandaPowerBackend(Backend):
             Gives the voltage angle (in degree) to the bus at which each storage unit is connected
         """
         return (
-            self.cst_1 * self.theta_or,
-            self.cst_1 * self.theta_ex,
-            self.cst_1 * self.load_theta,
-            self.cst_1 * self.gen_theta,
-            self.cst_1 * self.storage_theta,
+            self.theta_or.copy(),
+            self.theta_ex.copy(),
+            self.load_theta.copy(),
+            self.gen_theta.copy(),
+            self.storage_theta.copy(),
         )
     
     def get_nb_active_bus(self):
@@ -274,23 +540,26 @@ class PandaPowerBackend(Backend):
         res: :class:`int`
             The total number of active buses.
         """
-        return np.sum(self._grid.bus["in_service"])
+        return np.count_nonzero(self._bus_in_service_arr)
 
     @staticmethod
-    def _load_grid_load_p_mw(grid):
-        return grid.load["p_mw"]
+    def _aux_make_names(*parts):
+        """
+        INTERNAL
 
-    @staticmethod
-    def _load_grid_load_q_mvar(grid):
-        return grid.load["q_mvar"]
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
 
-    @staticmethod
-    def _load_grid_gen_p_mw(grid):
-        return grid.gen["p_mw"]
+        Build the default names of some elements, element wise, by joining the string representation
+        of each of the `parts` (either a str or an array) with "_".
 
-    @staticmethod
-    def _load_grid_gen_vm_pu(grid):
-        return grid.gen["vm_pu"]
+        For example `_aux_make_names("load", [3, 5], [0, 1])` gives `["load_3_0", "load_5_1"]`
+        """
+        res = None
+        for part in parts:
+            if not isinstance(part, str):
+                part = np.asarray(part).astype(str).astype(object)
+            res = part if res is None else res + "_" + part
+        return res.astype(str)
 
     def reset(self, path=None, grid_filename=None):
         """
@@ -299,15 +568,221 @@ class PandaPowerBackend(Backend):
         .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
 
         Reload the grid.
-        For pandapower, it is a bit faster to store of a copy of itself at the end of load_grid
-        and deep_copy it to itself instead of calling load_grid again
+        For pandapower, it is a lot faster to store a snapshot of the grid at the end of load_grid
+        and to copy it back, column by column, into the existing tables instead of calling load_grid again
         """
-        # Assign the content of itself as saved at the end of load_grid
-        self._grid = copy.deepcopy(self.__pp_backend_initial_grid)
+        # Assign the content of the grid as saved at the end of load_grid
+        self._restore_grid(self._grid_snapshot)
+        self._aux_cache_grid_arrays()
         self._reset_all_nan()
-        self._topo_vect[:] = self._get_topo_vect()
+        self._topo_vect[:] = self._initial_topo_vect
+        self.line_status[:] = self._get_line_status()
+        self._topo_dirty = False
+        self._ybus_dirty = True
         self.comp_time = 0.0
 
+    @staticmethod
+    def _copy_grid(grid):
+        """
+        INTERNAL
+
+        .. warning:: /!\\ Internal, do not use unless you know what you are doing /!\\
+
+        Faster equivalent of `copy.deepcopy(grid)`. Each table is copied with `DataFrame.copy`, only the
+        columns that can store python objects (same as in pandapower `__deepcopy__`) are copied element by element.
+        """
+        res = copy.copy(grid)
+        memo = {id(grid): res}
+        for key, val in grid.items():
+            if isinstance(val, pd.DataFrame):
+                tab = val.copy(deep=True)
+                for col in val.columns.intersection(["object", "coords", "geometry"]):
+                    tab[col] = pd.Series(
+                        [copy.deepcopy(el, memo) for el in val[col].values],
+                        index=val.index,
+                        dtype=val[col].dtype,
+                    )
+                res[key] = tab
+            else:
+                res[key] = copy.deepcopy(val, memo)
+        return res
+
+    @staticmethod
+    def _make_grid_snapshot(grid):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Store the content of a pandapower grid so that it can be restored later on with
+        :func:`PandaPowerBackend._restore_grid`.
+
+        Each table of the grid is stored as one (read only) numpy array per column, all the other
+        entries (`_ppc`, `_pd2ppc_lookups`, `std_types` etc.) are deep copied once.
+
+        The snapshot is never modified, so it can be shared between the copies of a backend.
+        """
+        tables = {}
+        others = {}
+        for key, val in grid.items():
+            if isinstance(val, pd.DataFrame):
+                cols = {}
+                for col in val.columns:
+                    cols[col] = val[col].values.copy()
+                    cols[col].flags.writeable = False
+                tables[key] = (val.index, val.columns, cols)
+            else:
+                others[key] = copy.deepcopy(val)
+        return tables, others
+
+    def _restore_grid(self, snapshot):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Restore `self._grid` to the state stored in `snapshot` (see :func:`PandaPowerBackend._make_grid_snapshot`).
+
+        When a table has the same layout as in the snapshot, its values are copied back in the existing numpy
+        arrays, without creating any new dataframe. Otherwise (or if `self._reset_inplace` is ``False``) the table
+        is rebuilt from the snapshot.
+        """
+        tables, others = snapshot
+        for key in [key for key in self._grid.keys() if key not in tables and key not in others]:
+            # added by pandapower after the snapshot was made
+            del self._grid[key]
+
+        for key, (index, columns, cols) in tables.items():
+            table = self._grid.get(key)
+            if (
+                self._reset_inplace
+                and isinstance(table, pd.DataFrame)
+                and table.columns.equals(columns)
+                and table.index.equals(index)
+            ):
+                if not index.shape[0]:
+                    # empty table, nothing to restore
+                    continue
+                try:
+                    for col, arr in cols.items():
+                        values = table[col].values
+                        values[:] = arr
+                        if isinstance(values, np.ndarray) and not np.may_share_memory(values, table[col].values):
+                            # pandas gave a copy of the column: the values were not written in the table
+                            table[col] = arr.copy()
+                    continue
+                except ValueError:
+                    # the underlying array is read only, the table is rebuilt below
+                    pass
+            self._grid[key] = pd.DataFrame(cols, index=index, columns=columns, copy=True)
+
+        for key, val in others.items():
+            self._grid[key] = copy.deepcopy(val)
+
+    def _aux_cache_grid_arrays(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Retrieve the numpy arrays in which pandapower stores the columns of the grid modified at each step, to
+        write directly in them instead of going through the pandas indexing machinery.
+
+        This needs to be called each time the tables of `self._grid` are (possibly) re created, for example
+        after a copy.
+        """
+        for attr_nm, table, col in self._cached_grid_cols:
+            setattr(self, attr_nm, self._grid[table][col].to_numpy())
+
+    def _aux_cached_arrays_valid(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Check that the arrays retrieved by :func:`PandaPowerBackend._aux_cache_grid_arrays` are still the ones in
+        which pandapower stores the columns of the grid (they are not if a column has been replaced,
+        eg with `self._grid.line["in_service"] = ...`).
+        """
+        for attr_nm, table, col in self._cached_grid_cols:
+            arr = getattr(self, attr_nm)
+            values = self._grid[table][col].values
+            if arr.shape != values.shape or (arr.size and not np.may_share_memory(arr, values)):
+                return False
+        return True
+
+    def _aux_ybus_signature(self):
+        # to check that pandapower can reuse its internal structures (see runpf)
+        return np.concatenate(
+            [getattr(self, attr_nm).astype(np.float64) for attr_nm in self._ybus_cached_attr]
+        )
+
+    def _invalidate_cache(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        This needs to be called each time `self._grid` is modified without using the methods of this class
+        (for example when `self._grid.line["in_service"]` is modified directly). The columns of the grid are
+        retrieved again and the topology vector, the status of the powerlines and the internal structures of
+        pandapower (admittance matrix) are recomputed at the next powerflow.
+        """
+        self._aux_cache_grid_arrays()
+        self._topo_dirty = True
+        self._ybus_dirty = True
+
+    def _aux_make_res_views(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Make all the result vectors (`p_or`, `load_v`, `gen_theta` etc.) views on the contiguous
+        buffer `self._res_buf`, so that they can all be reset with a single call.
+
+        This needs to be called each time `self._res_buf` is re created, for example after a copy.
+        """
+        beg_ = 0
+        for attrs, nb_el in (
+            (self._res_line_attr, self.n_line),
+            (self._res_load_attr, self.n_load),
+            (self._res_gen_attr, self.n_gen),
+            (self._res_storage_attr, self.n_storage),
+        ):
+            for attr_nm in attrs:
+                setattr(self, attr_nm, self._res_buf[beg_ : (beg_ + nb_el)])
+                beg_ += nb_el
+
+    def _aux_make_ro_views(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Create the read only views returned by :func:`PandaPowerBackend.get_line_status`,
+        :func:`PandaPowerBackend.get_line_flow` and :func:`PandaPowerBackend.get_topo_vect`.
+
+        This needs to be called each time the underlying vectors are re created, for example after a copy.
+        """
+        self._ro_line_status = self.line_status.view()
+        self._ro_line_status.flags.writeable = False
+        self._ro_a_or = self.a_or.view()
+        self._ro_a_or.flags.writeable = False
+        self._ro_topo_vect = self._topo_vect.view()
+        self._ro_topo_vect.flags.writeable = False
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._grid is not None:
+            # after a copy / pickle the numpy arrays are not the ones of the new grid anymore
+            self._aux_cache_grid_arrays()
+        if self.__dict__.get("_res_buf") is not None:
+            # same for the views on the result buffer
+            self._aux_make_res_views()
+        if self.__dict__.get("_topo_vect") is not None:
+            self._aux_make_ro_views()
+
     def load_grid(self, path=None, filename=None):
         """
         INTERNAL
@@ -346,23 +821,28 @@ class PandaPowerBackend(Backend):
         i_ref = None
         self._iref_slack = None
         self._id_bus_added = None
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore")
-            pp.runpp(
-                self._grid,
-                numba=numba_,
-                lightsim2grid=self._ligthsim2grid,
-                distributed_slack=self._dist_slack,
-                max_iteration=self._max_iter,
-            )
         new_pp_version = False
         if not "slack_weight" in self._grid.gen:
             self._grid.gen["slack_weight"] = 1.0
         else:
             new_pp_version = True
 
-        if np.all(~self._grid.gen["slack"]):
+        slack_id = np.flatnonzero(self._grid.gen["slack"].to_numpy())
+        if slack_id.size == 0:
             # there are not defined slack bus on the data, i need to hack it up a little bit
+            # a first powerflow is needed to retrieve the slack bus (and its setpoint) in the ppc
+            # (when a slack is defined, only the powerflow below is performed)
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore")
+                pp.runpp(
+                    self._grid,
+                    numba=numba_,
+                    lightsim2grid=self._ligthsim2grid,
+                    distributed_slack=self._dist_slack,
+                    max_iteration=self._max_iter,
+                    use_umfpack=self._use_umfpack,
+                    permc_spec=self._permc_spec,
+                )
             pd2ppc = self._grid._pd2ppc_lookups["bus"]  # pd2ppc[pd_id] = ppc_id
             ppc2pd = np.argsort(pd2ppc)  # ppc2pd[ppc_id] = pd_id
             for gen_id_pp, el in enumerate(self._grid._ppc["gen"][:, 0]):
@@ -417,7 +897,7 @@ class PandaPowerBackend(Backend):
                         # TODO here i force the distributed slack bus too, by removing the other from the ext_grid...
                         self._grid.ext_grid = self._grid.ext_grid.iloc[:1]
         else:
-            self.slack_id = np.where(self._grid.gen["slack"])[0]
+            self.slack_id = slack_id
 
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore")
@@ -427,19 +907,26 @@ class PandaPowerBackend(Backend):
                 lightsim2grid=self._ligthsim2grid,
                 distributed_slack=self._dist_slack,
                 max_iteration=self._max_iter,
+                use_umfpack=self._use_umfpack,
+                permc_spec=self._permc_spec,
             )
 
         self.__nb_bus_before = self._grid.bus.shape[0]
         self.__nb_powerline = self._grid.line.shape[0]
-        self._init_bus_load = self.cst_1 * self._grid.load["bus"].values
-        self._init_bus_gen = self.cst_1 * self._grid.gen["bus"].values
-        self._init_bus_lor = self.cst_1 * self._grid.line["from_bus"].values
-        self._init_bus_lex = self.cst_1 * self._grid.line["to_bus"].values
-
-        t_for = self.cst_1 * self._grid.trafo["hv_bus"].values
-        t_fex = self.cst_1 * self._grid.trafo["lv_bus"].values
-        self._init_bus_lor = np.concatenate((self._init_bus_lor, t_for)).astype(dt_int)
-        self._init_bus_lex = np.concatenate((self._init_bus_lex, t_fex)).astype(dt_int)
+        self._init_bus_load = self._grid.load["bus"].to_numpy(dtype=dt_int)
+        self._init_bus_gen = self._grid.gen["bus"].to_numpy(dtype=dt_int)
+        self._init_bus_lor = np.concatenate(
+            (
+                self._grid.line["from_bus"].to_numpy(dtype=dt_int),
+                self._grid.trafo["hv_bus"].to_numpy(dtype=dt_int),
+            )
+        )
+        self._init_bus_lex = np.concatenate(
+            (
+                self._grid.line["to_bus"].to_numpy(dtype=dt_int),
+                self._grid.trafo["lv_bus"].to_numpy(dtype=dt_int),
+            )
+        )
 
         self._grid["ext_grid"]["va_degree"] = 0.0
 
@@ -450,63 +937,59 @@ class PandaPowerBackend(Backend):
         # self._fact_mult_gen[-1] += 1
 
         # now extract the powergrid
-        self.n_line = copy.deepcopy(self._grid.line.shape[0]) + copy.deepcopy(
-            self._grid.trafo.shape[0]
-        )
+        self.n_line = self._grid.line.shape[0] + self._grid.trafo.shape[0]
+        nb_line = self._grid.line.shape[0]
         if (
             "name" in self._grid.line.columns
             and not self._grid.line["name"].isnull().values.any()
         ):
-            self.name_line = [name for name in self._grid.line["name"]]
+            name_line = self._grid.line["name"].to_numpy().astype(str)
         else:
-            self.name_line = [
-                "{from_bus}_{to_bus}_{id_powerline_me}".format(**row, id_powerline_me=i)
-                for i, (_, row) in enumerate(self._grid.line.iterrows())
-            ]
+            name_line = self._aux_make_names(
+                self._grid.line["from_bus"].to_numpy(),
+                self._grid.line["to_bus"].to_numpy(),
+                np.arange(nb_line),
+            )
         if (
             "name" in self._grid.trafo.columns
             and not self._grid.trafo["name"].isnull().values.any()
         ):
-            self.name_line += [name_traf for name_traf in self._grid.trafo["name"]]
+            name_trafo = self._grid.trafo["name"].to_numpy().astype(str)
         else:
-            transfo = [
-                ("{hv_bus}".format(**row), "{lv_bus}".format(**row))
-                for i, (_, row) in enumerate(self._grid.trafo.iterrows())
-            ]
-            transfo = [sorted(el) for el in transfo]
-            self.name_line += [
-                "{}_{}_{}".format(*el, i + self._grid.line.shape[0])
-                for i, el in enumerate(transfo)
-            ]
-        self.name_line = np.array(self.name_line)
+            # buses are sorted (as str) in the name of the transformers
+            hv_bus = self._grid.trafo["hv_bus"].to_numpy().astype(str)
+            lv_bus = self._grid.trafo["lv_bus"].to_numpy().astype(str)
+            hv_first = hv_bus <= lv_bus
+            name_trafo = self._aux_make_names(
+                np.where(hv_first, hv_bus, lv_bus),
+                np.where(hv_first, lv_bus, hv_bus),
+                np.arange(self._grid.trafo.shape[0]) + nb_line,
+            )
+        self.name_line = np.concatenate((name_line, name_trafo))
 
-        self.n_gen = copy.deepcopy(self._grid.gen.shape[0])
+        self.n_gen = self._grid.gen.shape[0]
         if (
             "name" in self._grid.gen.columns
             and not self._grid.gen["name"].isnull().values.any()
         ):
-            self.name_gen = [name_g for name_g in self._grid.gen["name"]]
+            self.name_gen = self._grid.gen["name"].to_numpy().astype(str)
         else:
-            self.name_gen = [
-                "gen_{bus}_{index_gen}".format(**row, index_gen=i)
-                for i, (_, row) in enumerate(self._grid.gen.iterrows())
-            ]
-        self.name_gen = np.array(self.name_gen)
+            self.name_gen = self._aux_make_names(
+                "gen", self._grid.gen["bus"].to_numpy(), np.arange(self.n_gen)
+            )
 
-        self.n_load = copy.deepcopy(self._grid.load.shape[0])
+        self.n_load = self._grid.load.shape[0]
         if (
             "name" in self._grid.load.columns
             and not self._grid.load["name"].isnull().values.any()
         ):
-            self.name_load = [nl for nl in self._grid.load["name"]]
+            self.name_load = self._grid.load["name"].to_numpy().astype(str)
         else:
-            self.name_load = [
-                "load_{bus}_{index_load}".format(**row, index_load=i)
-                for i, (_, row) in enumerate(self._grid.load.iterrows())
-            ]
-        self.name_load = np.array(self.name_load)
+            self.name_load = self._aux_make_names(
+                "load", self._grid.load["bus"].to_numpy(), np.arange(self.n_load)
+            )
 
-        self.n_storage = copy.deepcopy(self._grid.storage.shape[0])
+        self.n_storage = self._grid.storage.shape[0]
         if self.n_storage == 0:
             self.set_no_storage()
         else:
@@ -514,108 +997,87 @@ class PandaPowerBackend(Backend):
                 "name" in self._grid.storage.columns
                 and not self._grid.storage["name"].isnull().values.any()
             ):
-                self.name_storage = [nl for nl in self._grid.storage["name"]]
+                self.name_storage = self._grid.storage["name"].to_numpy().astype(str)
             else:
-                self.name_storage = [
-                    "storage_{bus}_{index_sto}".format(**row, index_sto=i)
-                    for i, (_, row) in enumerate(self._grid.storage.iterrows())
-                ]
-            self.name_storage = np.array(self.name_storage)
+                self.name_storage = self._aux_make_names(
+                    "storage",
+                    self._grid.storage["bus"].to_numpy(),
+                    np.arange(self.n_storage),
+                )
 
-        self.n_sub = copy.deepcopy(self._grid.bus.shape[0])
-        self.name_sub = ["sub_{}".format(i) for i, row in self._grid.bus.iterrows()]
-        self.name_sub = np.array(self.name_sub)
+        self.n_sub = self._grid.bus.shape[0]
+        self.name_sub = self._aux_make_names("sub", self._grid.bus.index.to_numpy())
 
         # "hack" to handle topological changes, for now only 2 buses per substation
-        add_topo = copy.deepcopy(self._grid.bus)
-        add_topo.index += add_topo.shape[0]
-        add_topo["in_service"] = False
-        self._grid.bus = pd.concat((self._grid.bus, add_topo))
+        # (the second bus of each substation is a copy of the first one, out of service)
+        bus = self._grid.bus
+        nb_bus = bus.shape[0]
+        cols = {col: np.concatenate((bus[col].values, bus[col].values)) for col in bus.columns}
+        cols["in_service"][nb_bus:] = False
+        self._grid.bus = pd.DataFrame(
+            cols, index=bus.index.append(bus.index + nb_bus), columns=bus.columns
+        )
+
+        # disconnected loads and generators are assigned to bus -1 (see `_apply_load_bus`
+        # and `_apply_gen_bus`) which cannot be stored in the unsigned columns of pandapower
+        self._grid.load["bus"] = self._grid.load["bus"].values.astype(np.int64)
+        self._grid.gen["bus"] = self._grid.gen["bus"].values.astype(np.int64)
 
         self._init_private_attrs()
 
     def _init_private_attrs(self):
-        #  number of elements per substation
-        self.sub_info = np.zeros(self.n_sub, dtype=dt_int)
-
-        self.load_to_subid = np.zeros(self.n_load, dtype=dt_int)
-        self.gen_to_subid = np.zeros(self.n_gen, dtype=dt_int)
-        self.line_or_to_subid = np.zeros(self.n_line, dtype=dt_int)
-        self.line_ex_to_subid = np.zeros(self.n_line, dtype=dt_int)
-
-        self.load_to_sub_pos = np.zeros(self.n_load, dtype=dt_int)
-        self.gen_to_sub_pos = np.zeros(self.n_gen, dtype=dt_int)
-        self.line_or_to_sub_pos = np.zeros(self.n_line, dtype=dt_int)
-        self.line_ex_to_sub_pos = np.zeros(self.n_line, dtype=dt_int)
-
+        # substation to which each element is connected
+        line_or_subid = self._grid.line["from_bus"].values.astype(dt_int)
+        line_ex_subid = self._grid.line["to_bus"].values.astype(dt_int)
+        trafo_hv_subid = self._grid.trafo["hv_bus"].values.astype(dt_int)
+        trafo_lv_subid = self._grid.trafo["lv_bus"].values.astype(dt_int)
+        self.line_or_to_subid = np.concatenate((line_or_subid, trafo_hv_subid))
+        self.line_ex_to_subid = np.concatenate((line_ex_subid, trafo_lv_subid))
+        self.gen_to_subid = self._grid.gen["bus"].values.astype(dt_int)
+        self.load_to_subid = self._grid.load["bus"].values.astype(dt_int)
         if self.n_storage > 0:
-            self.storage_to_subid = np.zeros(self.n_storage, dtype=dt_int)
-            self.storage_to_sub_pos = np.zeros(self.n_storage, dtype=dt_int)
-
-        pos_already_used = np.zeros(self.n_sub, dtype=dt_int)
-        self._what_object_where = [[] for _ in range(self.n_sub)]
-
-        for i, (_, row) in enumerate(self._grid.line.iterrows()):
-            sub_or_id = int(row["from_bus"])
-            sub_ex_id = int(row["to_bus"])
-            self.sub_info[sub_or_id] += 1
-            self.sub_info[sub_ex_id] += 1
-            self.line_or_to_subid[i] = sub_or_id
-            self.line_ex_to_subid[i] = sub_ex_id
-
-            self.line_or_to_sub_pos[i] = pos_already_used[sub_or_id]
-            pos_already_used[sub_or_id] += 1
-            self.line_ex_to_sub_pos[i] = pos_already_used[sub_ex_id]
-            pos_already_used[sub_ex_id] += 1
-
-            self._what_object_where[sub_or_id].append(("line", "from_bus", i))
-            self._what_object_where[sub_ex_id].append(("line", "to_bus", i))
-
-        lag_transfo = self._grid.line.shape[0]
-        self._number_true_line = copy.deepcopy(self._grid.line.shape[0])
-        for i, (_, row) in enumerate(self._grid.trafo.iterrows()):
-            sub_or_id = int(row["hv_bus"])
-            sub_ex_id = int(row["lv_bus"])
-            self.sub_info[sub_or_id] += 1
-            self.sub_info[sub_ex_id] += 1
-            self.line_or_to_subid[i + lag_transfo] = sub_or_id
-            self.line_ex_to_subid[i + lag_transfo] = sub_ex_id
-
-            self.line_or_to_sub_pos[i + lag_transfo] = pos_already_used[sub_or_id]
-            pos_already_used[sub_or_id] += 1
-            self.line_ex_to_sub_pos[i + lag_transfo] = pos_already_used[sub_ex_id]
-            pos_already_used[sub_ex_id] += 1
-
-            self._what_object_where[sub_or_id].append(("trafo", "hv_bus", i))
-            self._what_object_where[sub_ex_id].append(("trafo", "lv_bus", i))
-
-        for i, (_, row) in enumerate(self._grid.gen.iterrows()):
-            sub_id = int(row["bus"])
-            self.sub_info[sub_id] += 1
-            self.gen_to_subid[i] = sub_id
-            self.gen_to_sub_pos[i] = pos_already_used[sub_id]
-            pos_already_used[sub_id] += 1
-
-            self._what_object_where[sub_id].append(("gen", "bus", i))
-
-        for i, (_, row) in enumerate(self._grid.load.iterrows()):
-            sub_id = int(row["bus"])
-            self.sub_info[sub_id] += 1
-            self.load_to_subid[i] = sub_id
-            self.load_to_sub_pos[i] = pos_already_used[sub_id]
-            pos_already_used[sub_id] += 1
-
-            self._what_object_where[sub_id].append(("load", "bus", i))
+            self.storage_to_subid = self._grid.storage["bus"].values.astype(dt_int)
+        else:
+            self.storage_to_subid = np.zeros(0, dtype=dt_int)
 
+        # all the elements, in the order in which they are given their position in the substation
+        all_subid = np.concatenate(
+            (
+                np.stack((line_or_subid, line_ex_subid), axis=1).ravel(),
+                np.stack((trafo_hv_subid, trafo_lv_subid), axis=1).ravel(),
+                self.gen_to_subid,
+                self.load_to_subid,
+                self.storage_to_subid,
+            )
+        )
+
+        #  number of elements per substation
+        self.sub_info = np.bincount(all_subid, minlength=self.n_sub).astype(dt_int)
+
+        # position of each element in its substation (number of elements of the same substation before it)
+        order = np.argsort(all_subid, kind="stable")
+        sorted_subid = all_subid[order]
+        all_sub_pos = np.empty(all_subid.shape[0], dtype=dt_int)
+        all_sub_pos[order] = np.arange(all_subid.shape[0]) - np.searchsorted(
+            sorted_subid, sorted_subid
+        )
+        nb_line = self._grid.line.shape[0]
+        nb_trafo = self._grid.trafo.shape[0]
+        lines_pos = all_sub_pos[: 2 * nb_line].reshape(nb_line, 2)
+        trafos_pos = all_sub_pos[2 * nb_line : 2 * (nb_line + nb_trafo)].reshape(
+            nb_trafo, 2
+        )
+        self.line_or_to_sub_pos = np.concatenate((lines_pos[:, 0], trafos_pos[:, 0]))
+        self.line_ex_to_sub_pos = np.concatenate((lines_pos[:, 1], trafos_pos[:, 1]))
+        lag = 2 * (nb_line + nb_trafo)
+        self.gen_to_sub_pos = all_sub_pos[lag : lag + self.n_gen]
+        lag += self.n_gen
+        self.load_to_sub_pos = all_sub_pos[lag : lag + self.n_load]
+        lag += self.n_load
         if self.n_storage > 0:
-            for i, (_, row) in enumerate(self._grid.storage.iterrows()):
-                sub_id = int(row["bus"])
-                self.sub_info[sub_id] += 1
-                self.storage_to_subid[i] = sub_id
-                self.storage_to_sub_pos[i] = pos_already_used[sub_id]
-                pos_already_used[sub_id] += 1
+            self.storage_to_sub_pos = all_sub_pos[lag:]
 
-                self._what_object_where[sub_id].append(("storage", "bus", i))
+        self._number_true_line = self._grid.line.shape[0]
 
         self.dim_topo = np.sum(self.sub_info)
         self._compute_pos_big_topo()
@@ -623,20 +1085,6 @@ class PandaPowerBackend(Backend):
         # utilities for imeplementing apply_action
         self._corresp_name_fun = {}
 
-        self._get_vector_inj = {}
-        self._get_vector_inj[
-            "load_p"
-        ] = self._load_grid_load_p_mw  # lambda grid: grid.load["p_mw"]
-        self._get_vector_inj[
-            "load_q"
-        ] = self._load_grid_load_q_mvar  # lambda grid: grid.load["q_mvar"]
-        self._get_vector_inj[
-            "prod_p"
-        ] = self._load_grid_gen_p_mw  # lambda grid: grid.gen["p_mw"]
-        self._get_vector_inj[
-            "prod_v"
-        ] = self._load_grid_gen_vm_pu  # lambda grid: grid.gen["vm_pu"]
-
         self.load_pu_to_kv = self._grid.bus["vn_kv"][self.load_to_subid].values.astype(
             dt_float
         )
@@ -662,96 +1110,93 @@ class PandaPowerBackend(Backend):
         )
         self.thermal_limit_a = self.thermal_limit_a.astype(dt_float)
 
-        self.p_or = np.full(self.n_line, dtype=dt_float, fill_value=np.NaN)
-        self.q_or = np.full(self.n_line, dtype=dt_float, fill_value=np.NaN)
-        self.v_or = np.full(self.n_line, dtype=dt_float, fill_value=np.NaN)
-        self.a_or = np.full(self.n_line, dtype=dt_float, fill_value=np.NaN)
-        self.p_ex = np.full(self.n_line, dtype=dt_float, fill_value=np.NaN)
-        self.q_ex = np.full(self.n_line, dtype=dt_float, fill_value=np.NaN)
-        self.v_ex = np.full(self.n_line, dtype=dt_float, fill_value=np.NaN)
-        self.a_ex = np.full(self.n_line, dtype=dt_float, fill_value=np.NaN)
+        # all the results of the powerflow (p_or, load_v, gen_theta etc.) are views on this single buffer
+        nb_res = (
+            len(self._res_line_attr) * self.n_line
+            + len(self._res_load_attr) * self.n_load
+            + len(self._res_gen_attr) * self.n_gen
+            + len(self._res_storage_attr) * self.n_storage
+        )
+        self._res_buf = np.full(nb_res, dtype=dt_float, fill_value=np.NaN)
+        self._aux_make_res_views()
         self.line_status = np.full(self.n_line, dtype=dt_bool, fill_value=np.NaN)
-        self.load_p = np.full(self.n_load, dtype=dt_float, fill_value=np.NaN)
-        self.load_q = np.full(self.n_load, dtype=dt_float, fill_value=np.NaN)
-        self.load_v = np.full(self.n_load, dtype=dt_float, fill_value=np.NaN)
-        self.prod_p = np.full(self.n_gen, dtype=dt_float, fill_value=np.NaN)
-        self.prod_v = np.full(self.n_gen, dtype=dt_float, fill_value=np.NaN)
-        self.prod_q = np.full(self.n_gen, dtype=dt_float, fill_value=np.NaN)
-        self.storage_p = np.full(self.n_storage, dtype=dt_float, fill_value=np.NaN)
-        self.storage_q = np.full(self.n_storage, dtype=dt_float, fill_value=np.NaN)
-        self.storage_v = np.full(self.n_storage, dtype=dt_float, fill_value=np.NaN)
-        self._nb_bus_before = None
 
         # shunts data
         self.n_shunt = self._grid.shunt.shape[0]
-        self.shunt_to_subid = np.zeros(self.n_shunt, dtype=dt_int) - 1
-        name_shunt = []
+        self.shunt_to_subid = self._grid.shunt["bus"].to_numpy(dtype=dt_int)
         # TODO read name from the grid if provided
-        for i, (_, row) in enumerate(self._grid.shunt.iterrows()):
-            bus = int(row["bus"])
-            name_shunt.append("shunt_{bus}_{index_shunt}".format(**row, index_shunt=i))
-            self.shunt_to_subid[i] = bus
-        self.name_shunt = np.array(name_shunt)
+        self.name_shunt = self._aux_make_names(
+            "shunt", self._grid.shunt["bus"].to_numpy(), np.arange(self.n_shunt)
+        )
         self._sh_vnkv = self._grid.bus["vn_kv"][self.shunt_to_subid].values.astype(
             dt_float
         )
         self.shunts_data_available = True
 
-        # store the topoid -> objid
-        self._big_topo_to_obj = [(None, None) for _ in range(self.dim_topo)]
-        nm_ = "load"
-        for load_id, pos_big_topo in enumerate(self.load_pos_topo_vect):
-            self._big_topo_to_obj[pos_big_topo] = (load_id, nm_)
-        nm_ = "gen"
-        for gen_id, pos_big_topo in enumerate(self.gen_pos_topo_vect):
-            self._big_topo_to_obj[pos_big_topo] = (gen_id, nm_)
-        nm_ = "lineor"
-        for l_id, pos_big_topo in enumerate(self.line_or_pos_topo_vect):
-            self._big_topo_to_obj[pos_big_topo] = (l_id, nm_)
-        nm_ = "lineex"
-        for l_id, pos_big_topo in enumerate(self.line_ex_pos_topo_vect):
-            self._big_topo_to_obj[pos_big_topo] = (l_id, nm_)
-
-        # store the topoid -> objid
-        self._big_topo_to_backend = [(None, None, None) for _ in range(self.dim_topo)]
-        for load_id, pos_big_topo in enumerate(self.load_pos_topo_vect):
-            self._big_topo_to_backend[pos_big_topo] = (load_id, load_id, 0)
-        for gen_id, pos_big_topo in enumerate(self.gen_pos_topo_vect):
-            self._big_topo_to_backend[pos_big_topo] = (gen_id, gen_id, 1)
-        for l_id, pos_big_topo in enumerate(self.line_or_pos_topo_vect):
-            if l_id < self.__nb_powerline:
-                self._big_topo_to_backend[pos_big_topo] = (l_id, l_id, 2)
-            else:
-                self._big_topo_to_backend[pos_big_topo] = (
-                    l_id,
-                    l_id - self.__nb_powerline,
-                    3,
-                )
-        for l_id, pos_big_topo in enumerate(self.line_ex_pos_topo_vect):
-            if l_id < self.__nb_powerline:
-                self._big_topo_to_backend[pos_big_topo] = (l_id, l_id, 4)
-            else:
-                self._big_topo_to_backend[pos_big_topo] = (
-                    l_id,
-                    l_id - self.__nb_powerline,
-                    5,
-                )
-
-        self.theta_or = np.full(self.n_line, fill_value=np.NaN, dtype=dt_float)
-        self.theta_ex = np.full(self.n_line, fill_value=np.NaN, dtype=dt_float)
-        self.load_theta = np.full(self.n_load, fill_value=np.NaN, dtype=dt_float)
-        self.gen_theta = np.full(self.n_gen, fill_value=np.NaN, dtype=dt_float)
-        self.storage_theta = np.full(self.n_storage, fill_value=np.NaN, dtype=dt_float)
-
+        # store the topoid -> objid (type -1 is for storage units, not handled this way)
+        self._bt2b_id_backend = np.full(self.dim_topo, fill_value=-1, dtype=dt_int)
+        self._bt2b_id_topo = np.full(self.dim_topo, fill_value=-1, dtype=dt_int)
+        self._bt2b_type = np.full(self.dim_topo, fill_value=-1, dtype=dt_int)
+        load_id = np.arange(self.n_load, dtype=dt_int)
+        self._bt2b_id_backend[self.load_pos_topo_vect] = load_id
+        self._bt2b_id_topo[self.load_pos_topo_vect] = load_id
+        self._bt2b_type[self.load_pos_topo_vect] = 0
+        gen_id = np.arange(self.n_gen, dtype=dt_int)
+        self._bt2b_id_backend[self.gen_pos_topo_vect] = gen_id
+        self._bt2b_id_topo[self.gen_pos_topo_vect] = gen_id
+        self._bt2b_type[self.gen_pos_topo_vect] = 1
+        l_id = np.arange(self.n_line, dtype=dt_int)
+        is_trafo = l_id >= self.__nb_powerline
+        # for transformers, the id in the topology is the id of the trafo in pandapower
+        id_topo = l_id - is_trafo * self.__nb_powerline
+        self._bt2b_id_backend[self.line_or_pos_topo_vect] = l_id
+        self._bt2b_id_topo[self.line_or_pos_topo_vect] = id_topo
+        self._bt2b_type[self.line_or_pos_topo_vect] = np.where(is_trafo, 3, 2)
+        self._bt2b_id_backend[self.line_ex_pos_topo_vect] = l_id
+        self._bt2b_id_topo[self.line_ex_pos_topo_vect] = id_topo
+        self._bt2b_type[self.line_ex_pos_topo_vect] = np.where(is_trafo, 5, 4)
+
+        # position in the bus table of the bus 1 (first row) and bus 2 (second row) of each substation
+        self._active_bus_pos = self._grid.bus.index.get_indexer(
+            np.arange(2 * self.__nb_bus_before)
+        ).reshape(2, self.__nb_bus_before)
+
+        # used to assign the voltage of the loads in DC
+        # (generators are sorted by substation, then the generators of the substation of each load are looked up)
+        gen_order = np.argsort(self.gen_to_subid, kind="stable").astype(dt_int)
+        gen_sub_sorted = self.gen_to_subid[gen_order]
+        first_gen = np.searchsorted(gen_sub_sorted, self.load_to_subid, side="left")
+        nb_gen = np.searchsorted(gen_sub_sorted, self.load_to_subid, side="right") - first_gen
+        self._load_gen_pair_load = np.repeat(np.arange(self.n_load, dtype=dt_int), nb_gen)
+        pos_in_sub = np.arange(self._load_gen_pair_load.shape[0]) - np.repeat(
+            np.cumsum(nb_gen) - nb_gen, nb_gen
+        )
+        self._load_gen_pair_gen = gen_order[np.repeat(first_gen, nb_gen) + pos_in_sub]
+
+        self._aux_cache_grid_arrays()
+        if numba_:
+            # compile the numba functions now rather than during the first step (_fill_topo_vect is
+            # compiled by _get_topo_vect just below). This is done before the flags are cleared because
+            # the bus setters mark the topology as modified.
+            no_el = np.zeros(0, dtype=dt_int)
+            _translate_bus(no_el, self._init_bus_load[no_el], 0)
+            for fun_ in self._type_to_bus_set:
+                fun_(no_el, no_el, no_el)
+            _clean_flows(
+                self.a_or[:0], self.v_or[:0], self.line_status[:0], self.lines_or_pu_to_kv[:0]
+            )
+        self.line_status[:] = self._get_line_status()
         self._topo_vect = self._get_topo_vect()
+        self._initial_topo_vect = self._topo_vect.copy()
+        self._initial_topo_vect.flags.writeable = False
+        self._aux_make_ro_views()
+        self._topo_dirty = False
+        self._ybus_dirty = True
         self.tol = 1e-5  # this is NOT the pandapower tolerance !!!! this is used to check if a storage unit
         # produce / absorbs anything
 
-        # Create a deep copy of itself in the initial state
-        # Store it under super private attribute
-        self.__pp_backend_initial_grid = copy.deepcopy(
-            self._grid
-        )  # will be initialized in the "assert_grid_correct"
+        # Store a snapshot of the grid in its initial state, used by "reset"
+        self._grid_snapshot = self._make_grid_snapshot(self._grid)
 
     def storage_deact_for_backward_comaptibility(self):
         self._init_private_attrs()
@@ -768,7 +1213,10 @@ class PandaPowerBackend(Backend):
         - the type of object among: "load", "gen", "lineor" and "lineex"
 
         """
-        return self._big_topo_to_obj[id_big_topo]
+        type_obj = self._bt2b_type[id_big_topo]
+        if type_obj == -1:
+            return None, None
+        return int(self._bt2b_id_backend[id_big_topo]), self._bt2o_names[type_obj]
 
     def apply_action(self, backendAction=None):
         """
@@ -788,34 +1236,59 @@ class PandaPowerBackend(Backend):
             shunts__,
         ) = backendAction()
 
-        tmp_prod_p = self._get_vector_inj["prod_p"](self._grid)
-        if np.any(prod_p.changed):
-            tmp_prod_p.iloc[prod_p.changed] = prod_p.values[prod_p.changed]
+        # no iloc for bus, don't ask me why please :-/ (buses are identified by their label in the table)
+        # this is always done: the backend might have been reset since the last action
+        self._bus_in_service_arr[self._active_bus_pos] = active_bus.T
+
+        # check once what has been modified, and stop here if nothing has
+        prod_p_changed = np.any(prod_p.changed)
+        prod_v_changed = np.any(prod_v.changed)
+        load_p_changed = np.any(load_p.changed)
+        load_q_changed = np.any(load_q.changed)
+        storage_changed = self.n_storage > 0 and np.any(storage.changed)
+        topo_changed = np.any(topo__.changed)
+        shunt_p_changed = shunt_q_changed = shunt_bus_changed = False
+        if self.shunts_data_available:
+            shunt_p, shunt_q, shunt_bus = shunts__
+            shunt_p_changed = np.any(shunt_p.changed)
+            shunt_q_changed = np.any(shunt_q.changed)
+            shunt_bus_changed = np.any(shunt_bus.changed)
+
+        if not (
+            prod_p_changed
+            or prod_v_changed
+            or load_p_changed
+            or load_q_changed
+            or storage_changed
+            or topo_changed
+            or shunt_p_changed
+            or shunt_q_changed
+            or shunt_bus_changed
+        ):
+            return
 
-        tmp_prod_v = self._get_vector_inj["prod_v"](self._grid)
-        if np.any(prod_v.changed):
-            tmp_prod_v.iloc[prod_v.changed] = (
+        if prod_p_changed:
+            self._gen_p_arr[prod_p.changed] = prod_p.values[prod_p.changed]
+
+        if prod_v_changed:
+            self._gen_vm_arr[prod_v.changed] = (
                 prod_v.values[prod_v.changed] / self.prod_pu_to_kv[prod_v.changed]
             )
+            if self._id_bus_added is not None and prod_v.changed[self._id_bus_added]:
+                # handling of the slack bus, where "2" generators are present.
+                self._grid["ext_grid"]["vm_pu"] = 1.0 * self._gen_vm_arr[self._id_bus_added]
 
-        if self._id_bus_added is not None and prod_v.changed[self._id_bus_added]:
-            # handling of the slack bus, where "2" generators are present.
-            self._grid["ext_grid"]["vm_pu"] = 1.0 * tmp_prod_v[self._id_bus_added]
-
-        tmp_load_p = self._get_vector_inj["load_p"](self._grid)
-        if np.any(load_p.changed):
-            tmp_load_p.iloc[load_p.changed] = load_p.values[load_p.changed]
+        if load_p_changed:
+            self._load_p_arr[load_p.changed] = load_p.values[load_p.changed]
 
-        tmp_load_q = self._get_vector_inj["load_q"](self._grid)
-        if np.any(load_q.changed):
-            tmp_load_q.iloc[load_q.changed] = load_q.values[load_q.changed]
+        if load_q_changed:
+            self._load_q_arr[load_q.changed] = load_q.values[load_q.changed]
 
-        if self.n_storage > 0:
+        if storage_changed:
             # active setpoint
-            tmp_stor_p = self._grid.storage["p_mw"]
-            if np.any(storage.changed):
-                tmp_stor_p.iloc[storage.changed] = storage.values[storage.changed]
+            self._storage_p_arr[storage.changed] = storage.values[storage.changed]
 
+        if self.n_storage > 0 and topo_changed:
             # topology of the storage
             stor_bus = backendAction.get_storages_bus()
             new_bus_id = stor_bus.values[stor_bus.changed]  # id of the busbar 1 or 2 if
@@ -826,152 +1299,184 @@ class PandaPowerBackend(Backend):
             new_bus_num[~activated] = self.storage_to_subid[stor_bus.changed][
                 ~activated
             ]
-            self._grid.storage["in_service"].values[stor_bus.changed] = activated
-            self._grid.storage["bus"].values[stor_bus.changed] = new_bus_num
+            self._storage_in_service_arr[stor_bus.changed] = activated
+            self._topo_dirty = True
+            self._ybus_dirty = True
+            self._storage_bus_arr[stor_bus.changed] = new_bus_num
             self._topo_vect[self.storage_pos_topo_vect[stor_bus.changed]] = new_bus_num
             self._topo_vect[
                 self.storage_pos_topo_vect[stor_bus.changed][~activated]
             ] = -1
 
         if self.shunts_data_available:
-            shunt_p, shunt_q, shunt_bus = shunts__
-
-            if np.any(shunt_p.changed):
-                self._grid.shunt["p_mw"].iloc[shunt_p.changed] = shunt_p.values[
-                    shunt_p.changed
-                ]
-            if np.any(shunt_q.changed):
-                self._grid.shunt["q_mvar"].iloc[shunt_q.changed] = shunt_q.values[
-                    shunt_q.changed
-                ]
-            if np.any(shunt_bus.changed):
-                sh_service = shunt_bus.values[shunt_bus.changed] != -1
-                self._grid.shunt["in_service"].iloc[shunt_bus.changed] = sh_service
-                sh_bus1 = np.arange(len(shunt_bus))[
-                    shunt_bus.changed & shunt_bus.values == 1
-                ]
-                sh_bus2 = np.arange(len(shunt_bus))[
-                    shunt_bus.changed & shunt_bus.values == 2
-                ]
-                if len(sh_bus1) > 0:
-                    self._grid.shunt["bus"].iloc[sh_bus1] = self.shunt_to_subid[sh_bus1]
-                if len(sh_bus2) > 0:
-                    self._grid.shunt["bus"].iloc[sh_bus2] = (
-                        self.shunt_to_subid[sh_bus2] + self.__nb_bus_before
-                    )
+            # the shunts are part of the admittance matrix: it needs to be rebuilt when they are modified
+            if shunt_p_changed:
+                self._shunt_p_arr[shunt_p.changed] = shunt_p.values[shunt_p.changed]
+                self._ybus_dirty = True
+            if shunt_q_changed:
+                self._shunt_q_arr[shunt_q.changed] = shunt_q.values[shunt_q.changed]
+                self._ybus_dirty = True
+            if shunt_bus_changed:
+                # the bus of a disconnected shunt is not modified
+                id_shunt = np.flatnonzero(shunt_bus.changed)
+                self._aux_apply_topo(
+                    shunt_bus.values[id_shunt],
+                    id_shunt,
+                    id_shunt,
+                    self.shunt_to_subid,
+                    self._shunt_bus_arr,
+                    self._shunt_in_service_arr,
+                    False,
+                )
 
         # i made at least a real change, so i implement it in the backend
-        for id_el, new_bus in topo__:
-            id_el_backend, id_topo, type_obj = self._big_topo_to_backend[id_el]
-
-            if type_obj is not None:
-                # storage unit are handled elsewhere
-                self._type_to_bus_set[type_obj](new_bus, id_el_backend, id_topo)
-
-        bus_is = self._grid.bus["in_service"]
-        for i, (bus1_status, bus2_status) in enumerate(active_bus):
-            bus_is[i] = bus1_status  # no iloc for bus, don't ask me why please :-/
-            bus_is[i + self.__nb_bus_before] = bus2_status
+        # (all the elements of the same type are modified at once)
+        if topo_changed:
+            id_topo_vect = np.flatnonzero(topo__.changed)
+            new_bus = topo__.values[id_topo_vect]
+            type_obj = self._bt2b_type[id_topo_vect]
+            id_el_backend = self._bt2b_id_backend[id_topo_vect]
+            id_topo = self._bt2b_id_topo[id_topo_vect]
+            for type_, fun_ in enumerate(self._type_to_bus_set):
+                # storage unit (type -1) are handled elsewhere
+                is_type = type_obj == type_
+                if np.any(is_type):
+                    fun_(new_bus[is_type], id_el_backend[is_type], id_topo[is_type])
+
+    def _aux_apply_topo(
+        self, new_bus, id_init, id_out, init_bus, out_bus, out_in_service, set_bus_disconnected
+    ):
+        ok = _apply_topo_scatter(
+            new_bus,
+            id_init,
+            id_out,
+            init_bus,
+            self.__nb_bus_before,
+            out_bus,
+            out_in_service,
+            set_bus_disconnected,
+        )
+        self._topo_dirty = True
+        self._ybus_dirty = True
+        if not ok:
+            raise BackendError("grid2op bus must be -1, 1 or 2")
 
     def _apply_load_bus(self, new_bus, id_el_backend, id_topo):
-        new_bus_backend = self._pp_bus_from_grid2op_bus(
-            new_bus, self._init_bus_load[id_el_backend]
+        # disconnected loads are assigned to bus -1
+        self._aux_apply_topo(
+            new_bus,
+            id_el_backend,
+            id_el_backend,
+            self._init_bus_load,
+            self._load_bus_arr,
+            self._load_in_service_arr,
+            True,
         )
-        if new_bus_backend >= 0:
-            self._grid.load["bus"].iat[id_el_backend] = new_bus_backend
-            self._grid.load["in_service"].iat[id_el_backend] = True
-        else:
-            self._grid.load["in_service"].iat[id_el_backend] = False
-            self._grid.load["bus"].iat[id_el_backend] = -1
 
     def _apply_gen_bus(self, new_bus, id_el_backend, id_topo):
-        new_bus_backend = self._pp_bus_from_grid2op_bus(
-            new_bus, self._init_bus_gen[id_el_backend]
+        # disconnected generators are assigned to bus -1
+        self._aux_apply_topo(
+            new_bus,
+            id_el_backend,
+            id_el_backend,
+            self._init_bus_gen,
+            self._gen_bus_arr,
+            self._gen_in_service_arr,
+            True,
         )
-        if new_bus_backend >= 0:
-            self._grid.gen["bus"].iat[id_el_backend] = new_bus_backend
-            self._grid.gen["in_service"].iat[id_el_backend] = True
+        if self._iref_slack is not None:
             # remember in this case slack bus is actually 2 generators for pandapower !
-            if (
-                id_el_backend == (self._grid.gen.shape[0] - 1)
-                and self._iref_slack is not None
-            ):
-                self._grid.ext_grid["bus"].iat[0] = new_bus_backend
-        else:
-            self._grid.gen["in_service"].iat[id_el_backend] = False
-            self._grid.gen["bus"].iat[id_el_backend] = -1
-            # in this case the slack bus cannot be disconnected
+            # (and in this case the slack bus cannot be disconnected)
+            id_slack = self._grid.gen.shape[0] - 1
+            if np.any(id_el_backend == id_slack) and self._gen_in_service_arr[id_slack]:
+                self._ext_grid_bus_arr[0] = self._gen_bus_arr[id_slack]
 
     def _apply_lor_bus(self, new_bus, id_el_backend, id_topo):
-        new_bus_backend = self._pp_bus_from_grid2op_bus(
-            new_bus, self._init_bus_lor[id_el_backend]
+        self._aux_apply_topo(
+            new_bus,
+            id_el_backend,
+            id_el_backend,
+            self._init_bus_lor,
+            self._line_from_bus_arr,
+            self._line_in_service_arr,
+            False,
         )
-        self.change_bus_powerline_or(id_el_backend, new_bus_backend)
+
+    def _aux_change_bus(self, id_el_backend, new_bus_backend, out_bus, out_in_service):
+        # id_el_backend and new_bus_backend can be scalars or vectors
+        id_el_backend = np.atleast_1d(id_el_backend)
+        new_bus_backend = np.atleast_1d(new_bus_backend)
+        self._topo_dirty = True
+        self._ybus_dirty = True
+        connected = new_bus_backend >= 0
+        out_in_service[id_el_backend] = connected
+        out_bus[id_el_backend[connected]] = new_bus_backend[connected]
 
     def change_bus_powerline_or(self, id_powerline_backend, new_bus_backend):
-        if new_bus_backend >= 0:
-            self._grid.line["in_service"].iat[id_powerline_backend] = True
-            self._grid.line["from_bus"].iat[id_powerline_backend] = new_bus_backend
-        else:
-            self._grid.line["in_service"].iat[id_powerline_backend] = False
+        self._aux_change_bus(
+            id_powerline_backend, new_bus_backend, self._line_from_bus_arr, self._line_in_service_arr
+        )
 
     def _apply_lex_bus(self, new_bus, id_el_backend, id_topo):
-        new_bus_backend = self._pp_bus_from_grid2op_bus(
-            new_bus, self._init_bus_lex[id_el_backend]
+        self._aux_apply_topo(
+            new_bus,
+            id_el_backend,
+            id_el_backend,
+            self._init_bus_lex,
+            self._line_to_bus_arr,
+            self._line_in_service_arr,
+            False,
         )
-        self.change_bus_powerline_ex(id_el_backend, new_bus_backend)
 
     def change_bus_powerline_ex(self, id_powerline_backend, new_bus_backend):
-        if new_bus_backend >= 0:
-            self._grid.line["in_service"].iat[id_powerline_backend] = True
-            self._grid.line["to_bus"].iat[id_powerline_backend] = new_bus_backend
-        else:
-            self._grid.line["in_service"].iat[id_powerline_backend] = False
+        self._aux_change_bus(
+            id_powerline_backend, new_bus_backend, self._line_to_bus_arr, self._line_in_service_arr
+        )
 
     def _apply_trafo_hv(self, new_bus, id_el_backend, id_topo):
-        new_bus_backend = self._pp_bus_from_grid2op_bus(
-            new_bus, self._init_bus_lor[id_el_backend]
+        self._aux_apply_topo(
+            new_bus,
+            id_el_backend,
+            id_topo,
+            self._init_bus_lor,
+            self._trafo_hv_bus_arr,
+            self._trafo_in_service_arr,
+            False,
         )
-        self.change_bus_trafo_hv(id_topo, new_bus_backend)
 
     def change_bus_trafo_hv(self, id_powerline_backend, new_bus_backend):
-        if new_bus_backend >= 0:
-            self._grid.trafo["in_service"].iat[id_powerline_backend] = True
-            self._grid.trafo["hv_bus"].iat[id_powerline_backend] = new_bus_backend
-        else:
-            self._grid.trafo["in_service"].iat[id_powerline_backend] = False
+        self._aux_change_bus(
+            id_powerline_backend, new_bus_backend, self._trafo_hv_bus_arr, self._trafo_in_service_arr
+        )
 
     def _apply_trafo_lv(self, new_bus, id_el_backend, id_topo):
-        new_bus_backend = self._pp_bus_from_grid2op_bus(
-            new_bus, self._init_bus_lex[id_el_backend]
+        self._aux_apply_topo(
+            new_bus,
+            id_el_backend,
+            id_topo,
+            self._init_bus_lex,
+            self._trafo_lv_bus_arr,
+            self._trafo_in_service_arr,
+            False,
         )
-        self.change_bus_trafo_lv(id_topo, new_bus_backend)
 
     def change_bus_trafo_lv(self, id_powerline_backend, new_bus_backend):
-        if new_bus_backend >= 0:
-            self._grid.trafo["in_service"].iat[id_powerline_backend] = True
-            self._grid.trafo["lv_bus"].iat[id_powerline_backend] = new_bus_backend
-        else:
-            self._grid.trafo["in_service"].iat[id_powerline_backend] = False
+        self._aux_change_bus(
+            id_powerline_backend, new_bus_backend, self._trafo_lv_bus_arr, self._trafo_in_service_arr
+        )
 
     def _pp_bus_from_grid2op_bus(self, grid2op_bus, grid2op_bus_init):
-        if grid2op_bus == 1:
-            res = grid2op_bus_init
-        elif grid2op_bus == 2:
-            res = grid2op_bus_init + self.__nb_bus_before
-        elif grid2op_bus == -1:
-            res = -1
-        else:
-            raise BackendError("grid2op bus must be -1, 1 or 2")
-        return int(res)
+        """
+        INTERNAL
 
-    def _aux_get_line_info(self, colname1, colname2):
-        res = np.concatenate(
-            (
-                self._grid.res_line[colname1].values,
-                self._grid.res_trafo[colname2].values,
-            )
-        )
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Convert (vectors of) grid2op buses (-1, 1 or 2) into the id of the pandapower buses, knowing the
+        pandapower bus to which each element is connected when on bus 1.
+        """
+        res = _translate_bus(grid2op_bus, grid2op_bus_init, self.__nb_bus_before)
+        if np.any(res == _INVALID_BUS):
+            raise BackendError("grid2op bus must be -1, 1 or 2")
         return res
 
     def runpf(self, is_dc=False):
@@ -980,12 +1485,21 @@ class PandaPowerBackend(Backend):
 
         .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
 
-        Run a power flow on the underlying _grid. This implements an optimization of the powerflow
-        computation: if the number of
-        buses has not changed between two calls, the previous results are re used. This speeds up the computation
-        in case of "do nothing" action applied.
+        Run a power flow on the underlying _grid. Without `recycle` the ac powerflows are always initialized
+        with a dc powerflow (the results of the previous powerflow are not used as a starting point).
+
+        With `recycle=True`, when neither the topology nor the grid parameters changed since the last
+        powerflow, pandapower reuses the options and the admittance matrix of the previous powerflow and the
+        ac powerflow then starts from the previous results instead (a dc initialization is still done
+        otherwise).
         """
-        nb_bus = self.get_nb_active_bus()
+        if (
+            type(self).apply_action is not PandaPowerBackend.apply_action
+            or not self._aux_cached_arrays_valid()
+        ):
+            # the grid may have been modified without the setters of this class (eg by the apply_action
+            # of a subclass, or some of its columns replaced) in which case the flags cannot be trusted
+            self._invalidate_cache()
         try:
             with warnings.catch_warnings():
                 # remove the warning if _grid non connex. And it that case load flow as not converged
@@ -994,35 +1508,42 @@ class PandaPowerBackend(Backend):
                 )
                 warnings.filterwarnings("ignore", category=RuntimeWarning)
                 warnings.filterwarnings("ignore", category=DeprecationWarning)
-                if self._nb_bus_before is None:
-                    self._pf_init = "dc"
-                elif nb_bus == self._nb_bus_before:
-                    self._pf_init = "results"
-                else:
-                    self._pf_init = "auto"
-
-                if np.any(~self._grid.load["in_service"]):
+                if not self._load_in_service_arr.all():
                     # TODO see if there is a better way here -> do not handle this here, but rather in Backend._next_grid_state
                     raise pp.powerflow.LoadflowNotConverged("Isolated load")
-                if np.any(~self._grid.gen["in_service"]):
+                if not self._gen_in_service_arr.all():
                     # TODO see if there is a better way here -> do not handle this here, but rather in Backend._next_grid_state
                     raise pp.powerflow.LoadflowNotConverged("Isolated gen")
 
                 if is_dc:
                     pp.rundcpp(self._grid, check_connectivity=False)
-                    self._nb_bus_before = (
-                        None  # if dc i start normally next time i call an ac powerflow
-                    )
+                    self._ybus_dirty = True  # the internal structures of pandapower are the dc ones
                 else:
+                    recycle = None
+                    if self._recycle and not self._ybus_dirty:
+                        if np.array_equal(self._aux_ybus_signature(), self._ybus_signature):
+                            # only the injections changed since the last ac powerflow: pandapower can reuse its
+                            # internal structures (including the admittance matrix)
+                            recycle = {"bus_pq": True, "trafo": False, "gen": True}
+                        else:
+                            # the grid has been modified without the methods of this class (and
+                            # without calling _invalidate_cache): nothing can be reused
+                            self._topo_dirty = True
                     pp.runpp(
                         self._grid,
                         check_connectivity=False,
                         init=self._pf_init,
                         numba=numba_,
-                        ligthsim2grid=self._ligthsim2grid,
+                        lightsim2grid=self._ligthsim2grid,
                         max_iteration=self._max_iter,
                         distributed_slack=self._dist_slack,
+                        use_umfpack=self._use_umfpack,
+                        permc_spec=self._permc_spec,
+                        recycle=recycle,
                     )
+                    self._ybus_dirty = False
+                    if self._recycle:
+                        self._ybus_signature = self._aux_ybus_signature()
 
                 # stores the computation time
                 if "_ppc" in self._grid:
@@ -1055,49 +1576,47 @@ class PandaPowerBackend(Backend):
                     # self._grid.res_bus["vm_pu"] is always nan when computed in DC
                     self.load_v[:] = self.load_pu_to_kv  # TODO
                     # need to assign the correct value when a generator is present at the same bus
-                    # TODO optimize this ugly loop
-                    for l_id in range(self.n_load):
-                        if self.load_to_subid[l_id] in self.gen_to_subid:
-                            ind_gens = np.where(
-                                self.gen_to_subid == self.load_to_subid[l_id]
-                            )[0]
-                            for g_id in ind_gens:
-                                if (
-                                    self._topo_vect[self.load_pos_topo_vect[l_id]]
-                                    == self._topo_vect[self.load_pos_topo_vect[g_id]]
-                                ):
-                                    self.load_v[l_id] = self.prod_v[g_id]
-                                    break
-
-                self.line_status[:] = self._get_line_status()
+                    # (the first generator connected to the same bus is used)
+                    same_bus = (
+                        self._topo_vect[self.load_pos_topo_vect[self._load_gen_pair_load]]
+                        == self._topo_vect[self.gen_pos_topo_vect[self._load_gen_pair_gen]]
+                    )
+                    l_id, first_pair = np.unique(
+                        self._load_gen_pair_load[same_bus], return_index=True
+                    )
+                    self.load_v[l_id] = self.prod_v[
+                        self._load_gen_pair_gen[same_bus][first_pair]
+                    ]
+
+                if self._topo_dirty:
+                    # otherwise the status is kept up to date by _disconnect_line / _reconnect_line
+                    self.line_status[:] = self._get_line_status()
                 # I retrieve the data once for the flows, so has to not re read multiple dataFrame
-                self.p_or[:] = self._aux_get_line_info("p_from_mw", "p_hv_mw")
-                self.q_or[:] = self._aux_get_line_info("q_from_mvar", "q_hv_mvar")
-                self.v_or[:] = self._aux_get_line_info("vm_from_pu", "vm_hv_pu")
-                self.a_or[:] = self._aux_get_line_info("i_from_ka", "i_hv_ka") * 1000
-                self.theta_or[:] = self._aux_get_line_info(
-                    "va_from_degree", "va_hv_degree"
-                )
-                self.a_or[~np.isfinite(self.a_or)] = 0.0
-                self.v_or[~np.isfinite(self.v_or)] = 0.0
-
-                self.p_ex[:] = self._aux_get_line_info("p_to_mw", "p_lv_mw")
-                self.q_ex[:] = self._aux_get_line_info("q_to_mvar", "q_lv_mvar")
-                self.v_ex[:] = self._aux_get_line_info("vm_to_pu", "vm_lv_pu")
-                self.a_ex[:] = self._aux_get_line_info("i_to_ka", "i_lv_ka") * 1000
-                self.theta_ex[:] = self._aux_get_line_info(
-                    "va_to_degree", "va_lv_degree"
-                )
-                self.a_ex[~np.isfinite(self.a_ex)] = 0.0
-                self.v_ex[~np.isfinite(self.v_ex)] = 0.0
+                # (the result tables are new objects after each powerflow, so they cannot be cached)
+                # powerlines first, then transformers, written directly in the output vectors
+                res_line = self._grid.res_line
+                res_trafo = self._grid.res_trafo
+                nb = self._number_true_line
+                for col_line, col_trafo, out, factor in (
+                    ("p_from_mw", "p_hv_mw", self.p_or, 1.0),
+                    ("q_from_mvar", "q_hv_mvar", self.q_or, 1.0),
+                    ("vm_from_pu", "vm_hv_pu", self.v_or, 1.0),
+                    ("i_from_ka", "i_hv_ka", self.a_or, 1000.0),  # kA -> A
+                    ("va_from_degree", "va_hv_degree", self.theta_or, 1.0),
+                    ("p_to_mw", "p_lv_mw", self.p_ex, 1.0),
+                    ("q_to_mvar", "q_lv_mvar", self.q_ex, 1.0),
+                    ("vm_to_pu", "vm_lv_pu", self.v_ex, 1.0),
+                    ("i_to_ka", "i_lv_ka", self.a_ex, 1000.0),  # kA -> A
+                    ("va_to_degree", "va_lv_degree", self.theta_ex, 1.0),
+                ):
+                    # the conversion is done on the pandapower (float64) values, before they are cast to dt_float
+                    np.multiply(res_line[col_line].values, factor, out=out[:nb], casting="same_kind")
+                    np.multiply(res_trafo[col_trafo].values, factor, out=out[nb:], casting="same_kind")
 
                 # it seems that pandapower does not take into account disconencted powerline for their voltage
-                self.v_or[~self.line_status] = 0.0
-                self.v_ex[~self.line_status] = 0.0
-                self.v_or[:] *= self.lines_or_pu_to_kv
-                self.v_ex[:] *= self.lines_ex_pu_to_kv
+                _clean_flows(self.a_or, self.v_or, self.line_status, self.lines_or_pu_to_kv)
+                _clean_flows(self.a_ex, self.v_ex, self.line_status, self.lines_ex_pu_to_kv)
 
-                self._nb_bus_before = None
                 self._grid._ppc["gen"][self._iref_slack, 1] = 0.0
 
                 # handle storage units
@@ -1116,17 +1635,122 @@ class PandaPowerBackend(Backend):
                 self.storage_p[deact_storage] = 0.0
                 self.storage_q[deact_storage] = 0.0
                 self.storage_v[deact_storage] = 0.0
-                self._grid.storage["in_service"].values[deact_storage] = False
-
-                self._topo_vect[:] = self._get_topo_vect()
+                if np.any(deact_storage):
+                    self._storage_in_service_arr[deact_storage] = False
+                    self._topo_dirty = True
+                    self._ybus_dirty = True
+
+                if self._topo_dirty:
+                    # the powerflow itself does not modify the topology
+                    self._topo_vect[:] = self._get_topo_vect()
+                    self._topo_dirty = False
                 return self._grid.converged, None
 
         except pp.powerflow.LoadflowNotConverged as exc_:
             # of the powerflow has not converged, results are Nan
             self._reset_all_nan()
+            self._topo_dirty = True
+            self._ybus_dirty = True
             msg = exc_.__str__()
             return False, DivergingPowerFlow(f'powerflow diverged with error :"{msg}"')
 
+    def _aux_get_batch_state(self):
+        # everything a powerflow can modify: the grid itself (eg the status of the isolated storage units, the
+        # internal structures of pandapower) and the topology information (and flags) kept by the backend
+        return (
+            self._make_grid_snapshot(self._grid),
+            self._topo_vect.copy(),
+            self.line_status.copy(),
+            self._topo_dirty,
+            self._ybus_dirty,
+            copy.deepcopy(self._ybus_signature),
+        )
+
+    def _aux_restore_batch_state(self, state):
+        snapshot, topo_vect, line_status, topo_dirty, ybus_dirty, ybus_signature = state
+        self._restore_grid(snapshot)
+        self._aux_cache_grid_arrays()
+        self._topo_vect[:] = topo_vect
+        self.line_status[:] = line_status
+        self._topo_dirty = topo_dirty
+        self._ybus_dirty = ybus_dirty
+        self._ybus_signature = copy.deepcopy(ybus_signature)
+
+    def _aux_runpf_injections(self, init_state, injections, is_dc):
+        # restore the initial state (so that the scenarios do not depend on each other), then modify
+        # the injections given in `injections`
+        self._aux_restore_batch_state(init_state)
+        if "load_p" in injections:
+            self._load_p_arr[:] = injections["load_p"]
+        if "load_q" in injections:
+            self._load_q_arr[:] = injections["load_q"]
+        if "prod_p" in injections:
+            self._gen_p_arr[:] = injections["prod_p"]
+        if "prod_v" in injections:
+            self._gen_vm_arr[:] = injections["prod_v"] / self.prod_pu_to_kv
+            if self._id_bus_added is not None:
+                self._grid["ext_grid"]["vm_pu"] = 1.0 * self._gen_vm_arr[self._id_bus_added]
+
+        conv, exc_ = self.runpf(is_dc=is_dc)
+        return (
+            conv,
+            exc_,
+            *self.generators_info(),
+            *self.loads_info(),
+            *self.lines_or_info(),
+            *self.lines_ex_info(),
+        )
+
+    def runpf_batch(self, injections, is_dc=False, nb_process=None):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Run one powerflow for each element of `injections`, in parallel (with :class:`multiprocessing.Pool`).
+
+        All the powerflows are computed on the current grid (topology, status of the powerlines etc.) in which
+        only the injections given in each element of `injections` are modified. The backend itself is not
+        modified.
+
+        Each process receives a copy of this backend once, when it is started,
+        and re uses it for all the scenarios it is given (its state is restored before each of them, so the
+        results do not depend on `nb_process`).
+
+        Parameters
+        ----------
+        injections: ``list``
+            One element per powerflow. Each element is a dictionary with (some of) the keys "load_p", "load_q",
+            "prod_p" (in MW / MVAr) and "prod_v" (in kV), mapping to a vector of the same size as
+            the number of loads (or generators). Injections not in the dictionary keep their current value.
+
+        is_dc: ``bool``
+            Whether to run DC powerflows (``False`` by default: AC powerflows)
+
+        nb_process: ``int``
+            Number of processes used. ``None`` (default) uses as many processes as cpus. If ``1``, no process
+            is created and the powerflows are computed sequentially.
+
+        Returns
+        -------
+        res: ``list``
+            One flat tuple per element of `injections`: `(converged, exception, prod_p, prod_q, prod_v,
+            load_p, load_q, load_v, p_or, q_or, v_or, a_or, p_ex, q_ex, v_ex, a_ex)`. If the powerflow
+            diverged, `converged` is ``False``, `exception` is the :class:`grid2op.Exceptions.DivergingPowerFlow`
+            and all the vectors are Nan.
+
+        """
+        args = [(inj, is_dc) for inj in injections]
+        if nb_process == 1:
+            backend = self.copy()
+            init_state = backend._aux_get_batch_state()
+            return [backend._aux_runpf_injections(init_state, *el) for el in args]
+
+        backend_bytes = pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+        with Pool(nb_process, initializer=_aux_batch_init, initargs=(backend_bytes,)) as p:
+            res = p.map(_aux_batch_runpf, args)
+        return res
+
     def assert_grid_correct(self):
         """
         INTERNAL
@@ -1138,30 +1762,7 @@ class PandaPowerBackend(Backend):
         super().assert_grid_correct()
 
     def _reset_all_nan(self):
-        self.p_or[:] = np.NaN
-        self.q_or[:] = np.NaN
-        self.v_or[:] = np.NaN
-        self.a_or[:] = np.NaN
-        self.p_ex[:] = np.NaN
-        self.q_ex[:] = np.NaN
-        self.v_ex[:] = np.NaN
-        self.a_ex[:] = np.NaN
-        self.prod_p[:] = np.NaN
-        self.prod_q[:] = np.NaN
-        self.prod_v[:] = np.NaN
-        self.load_p[:] = np.NaN
-        self.load_q[:] = np.NaN
-        self.load_v[:] = np.NaN
-        self.storage_p[:] = np.NaN
-        self.storage_q[:] = np.NaN
-        self.storage_v[:] = np.NaN
-        self._nb_bus_before = None
-
-        self.theta_or[:] = np.NaN
-        self.theta_ex[:] = np.NaN
-        self.load_theta[:] = np.NaN
-        self.gen_theta[:] = np.NaN
-        self.storage_theta[:] = np.NaN
+        self._res_buf.fill(np.NaN)
 
     def copy(self):
         """
@@ -1176,9 +1777,16 @@ class PandaPowerBackend(Backend):
         res = type(self)(
             detailed_infos_for_cascading_failures=self.detailed_infos_for_cascading_failures
         )
+        res._ligthsim2grid = self._ligthsim2grid
+        res._dist_slack = self._dist_slack
+        res._max_iter = self._max_iter
+        res._use_umfpack = self._use_umfpack
+        res._permc_spec = self._permc_spec
+        res._recycle = self._recycle
 
         # copy from base class (backend)
-        res._grid = copy.deepcopy(self._grid)
+        res._grid = self._copy_grid(self._grid)
+        res._aux_cache_grid_arrays()
         res.thermal_limit_a = copy.deepcopy(self.thermal_limit_a)
         res._sh_vnkv = copy.deepcopy(self._sh_vnkv)
         res.comp_time = self.comp_time
@@ -1192,45 +1800,31 @@ class PandaPowerBackend(Backend):
         res.lines_ex_pu_to_kv = copy.deepcopy(self.lines_ex_pu_to_kv)
         res.storage_pu_to_kv = copy.deepcopy(self.storage_pu_to_kv)
 
-        res.p_or = copy.deepcopy(self.p_or)
-        res.q_or = copy.deepcopy(self.q_or)
-        res.v_or = copy.deepcopy(self.v_or)
-        res.a_or = copy.deepcopy(self.a_or)
-        res.p_ex = copy.deepcopy(self.p_ex)
-        res.q_ex = copy.deepcopy(self.q_ex)
-        res.v_ex = copy.deepcopy(self.v_ex)
-        res.a_ex = copy.deepcopy(self.a_ex)
-
-        res.load_p = copy.deepcopy(self.load_p)
-        res.load_q = copy.deepcopy(self.load_q)
-        res.load_v = copy.deepcopy(self.load_v)
-
-        res.storage_p = copy.deepcopy(self.storage_p)
-        res.storage_q = copy.deepcopy(self.storage_q)
-        res.storage_v = copy.deepcopy(self.storage_v)
-
-        res.prod_p = copy.deepcopy(self.prod_p)
-        res.prod_q = copy.deepcopy(self.prod_q)
-        res.prod_v = copy.deepcopy(self.prod_v)
+        res._res_buf = copy.deepcopy(self._res_buf)
+        if res._res_buf is not None:
+            res._aux_make_res_views()
         res.line_status = copy.deepcopy(self.line_status)
 
         res._pf_init = self._pf_init
-        res._nb_bus_before = self._nb_bus_before
 
         res.thermal_limit_a = copy.deepcopy(self.thermal_limit_a)
 
         res._iref_slack = self._iref_slack
         res._id_bus_added = self._id_bus_added
-        res._fact_mult_gen = copy.deepcopy(self._fact_mult_gen)
-        res._what_object_where = copy.deepcopy(self._fact_mult_gen)
+        res._fact_mult_gen = self._fact_mult_gen.copy()
         res._number_true_line = self._number_true_line
         res._corresp_name_fun = copy.deepcopy(self._corresp_name_fun)
-        # res._get_vector_inj = copy.deepcopy(self._get_vector_inj)  # ptr to functions member
         res.dim_topo = self.dim_topo
         # self._vars_action = BaseAction.attr_list_vect  # init from class, so should be good
         # self._vars_action_set = BaseAction.attr_list_vect  # init from class, so should be good
         res.cst_1 = self.cst_1
         res._topo_vect = copy.deepcopy(self._topo_vect)
+        res._initial_topo_vect = self._initial_topo_vect  # read only, no need to copy it
+        if res._topo_vect is not None:
+            res._aux_make_ro_views()
+        res._topo_dirty = self._topo_dirty
+        res._ybus_dirty = self._ybus_dirty
+        res._ybus_signature = copy.deepcopy(self._ybus_signature)
         res.slack_id = self.slack_id
 
         # function to rstore some information
@@ -1244,10 +1838,14 @@ class PandaPowerBackend(Backend):
         res._init_bus_gen = copy.deepcopy(self._init_bus_gen)
         res._init_bus_lor = copy.deepcopy(self._init_bus_lor)
         res._init_bus_lex = copy.deepcopy(self._init_bus_lex)
-        res._get_vector_inj = copy.deepcopy(self._get_vector_inj)
-        res._big_topo_to_obj = copy.deepcopy(self._big_topo_to_obj)
-        res._big_topo_to_backend = copy.deepcopy(self._big_topo_to_backend)
-        res.__pp_backend_initial_grid = copy.deepcopy(self.__pp_backend_initial_grid)
+        res._bt2b_id_backend = copy.deepcopy(self._bt2b_id_backend)
+        res._bt2b_id_topo = copy.deepcopy(self._bt2b_id_topo)
+        res._bt2b_type = copy.deepcopy(self._bt2b_type)
+        res._active_bus_pos = copy.deepcopy(self._active_bus_pos)
+        res._load_gen_pair_load = copy.deepcopy(self._load_gen_pair_load)
+        res._load_gen_pair_gen = copy.deepcopy(self._load_gen_pair_gen)
+        res._grid_snapshot = self._grid_snapshot  # read only, no need to copy it
+        res._reset_inplace = self._reset_inplace
 
         # Mapping some fun to apply bus updates
         # self._type_to_bus_set =  ...   # function ptr to function member
@@ -1259,11 +1857,6 @@ class PandaPowerBackend(Backend):
 
         # TODO storage doc (in grid2op rst) of the backend
         res.can_output_theta = self.can_output_theta  # I support the voltage angle
-        res.theta_or = copy.deepcopy(self.theta_or)
-        res.theta_ex = copy.deepcopy(self.theta_ex)
-        res.load_theta = copy.deepcopy(self.load_theta)
-        res.gen_theta = copy.deepcopy(self.gen_theta)
-        res.storage_theta = copy.deepcopy(self.storage_theta)
 
         return res
 
@@ -1278,8 +1871,8 @@ class PandaPowerBackend(Backend):
         """
         del self._grid
         self._grid = None
-        del self.__pp_backend_initial_grid
-        self.__pp_backend_initial_grid = None
+        del self._grid_snapshot
+        self._grid_snapshot = None
 
     def save_file(self, full_path):
         """
@@ -1295,6 +1888,37 @@ class PandaPowerBackend(Backend):
         """
         pp.to_json(self._grid, full_path)
 
+    def save_file_fast(self, full_path):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Save the grid in a binary (pickle) format. This is much faster than :func:`PandaPowerBackend.save_file`
+        (the tables are not converted to json) but the file can only be read back with
+        :func:`PandaPowerBackend.load_file_fast`, with the same versions of pandas and pandapower.
+
+        :param full_path: the full path (path + file name + extension) where *self._grid* is stored.
+        :return: ``None``
+        """
+        with open(full_path, "wb") as f:
+            pickle.dump(self._grid, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def load_file_fast(full_path):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Read a grid saved with :func:`PandaPowerBackend.save_file_fast`.
+
+        :param full_path: the full path (path + file name + extension) of the file
+        :return: the pandapower grid
+        """
+        with open(full_path, "rb") as f:
+            return pickle.load(f)
+
     def get_line_status(self):
         """
         INTERNAL
@@ -1303,117 +1927,78 @@ class PandaPowerBackend(Backend):
 
         As all the functions related to powerline, pandapower split them into multiple dataframe (some for transformers,
         some for 3 winding transformers etc.). We make sure to get them all here.
+
+        The vector returned is a read only view on the internal buffer of the backend (it is not copied).
         """
-        return self.line_status
+        return self._ro_line_status
 
     def _get_line_status(self):
         return np.concatenate(
-            (
-                self._grid.line["in_service"].values,
-                self._grid.trafo["in_service"].values,
-            )
+            (self._line_in_service_arr, self._trafo_in_service_arr)
         ).astype(dt_bool)
 
     def get_line_flow(self):
-        return self.a_or
+        return self._ro_a_or
 
     def _disconnect_line(self, id_):
         if id_ < self._number_true_line:
-            self._grid.line["in_service"].iloc[id_] = False
+            self._line_in_service_arr[id_] = False
         else:
-            self._grid.trafo["in_service"].iloc[id_ - self._number_true_line] = False
+            self._trafo_in_service_arr[id_ - self._number_true_line] = False
         self._topo_vect[self.line_or_pos_topo_vect[id_]] = -1
         self._topo_vect[self.line_ex_pos_topo_vect[id_]] = -1
         self.line_status[id_] = False
+        self._ybus_dirty = True
 
     def _reconnect_line(self, id_):
         if id_ < self._number_true_line:
-            self._grid.line["in_service"].iloc[id_] = True
+            self._line_in_service_arr[id_] = True
         else:
-            self._grid.trafo["in_service"].iloc[id_ - self._number_true_line] = True
+            self._trafo_in_service_arr[id_ - self._number_true_line] = True
         self.line_status[id_] = True
+        self._topo_dirty = True
+        self._ybus_dirty = True
 
     def get_topo_vect(self):
-        return self._topo_vect
+        return self._ro_topo_vect
 
     def _get_topo_vect(self):
         res = np.full(self.dim_topo, fill_value=np.NaN, dtype=dt_int)
 
-        line_status = self.get_line_status()
-
-        i = 0
-        for row in self._grid.line[["from_bus", "to_bus"]].values:
-            bus_or_id = row[0]
-            bus_ex_id = row[1]
-            if line_status[i]:
-                res[self.line_or_pos_topo_vect[i]] = (
-                    1 if bus_or_id == self.line_or_to_subid[i] else 2
-                )
-                res[self.line_ex_pos_topo_vect[i]] = (
-                    1 if bus_ex_id == self.line_ex_to_subid[i] else 2
-                )
-            else:
-                res[self.line_or_pos_topo_vect[i]] = -1
-                res[self.line_ex_pos_topo_vect[i]] = -1
-            i += 1
+        line_status = self.line_status
 
+        # powerlines first, then transformers (same order as in grid2op)
         nb = self._number_true_line
-        i = 0
-        for row in self._grid.trafo[["hv_bus", "lv_bus"]].values:
-            bus_or_id = row[0]
-            bus_ex_id = row[1]
-
-            j = i + nb
-            if line_status[j]:
-                res[self.line_or_pos_topo_vect[j]] = (
-                    1 if bus_or_id == self.line_or_to_subid[j] else 2
-                )
-                res[self.line_ex_pos_topo_vect[j]] = (
-                    1 if bus_ex_id == self.line_ex_to_subid[j] else 2
-                )
-            else:
-                res[self.line_or_pos_topo_vect[j]] = -1
-                res[self.line_ex_pos_topo_vect[j]] = -1
-            i += 1
-
-        i = 0
-        for bus_id in self._grid.gen["bus"].values:
-            res[self.gen_pos_topo_vect[i]] = 1 if bus_id == self.gen_to_subid[i] else 2
-            i += 1
-
-        i = 0
-        for bus_id in self._grid.load["bus"].values:
-            res[self.load_pos_topo_vect[i]] = (
-                1 if bus_id == self.load_to_subid[i] else 2
-            )
-            i += 1
+        or_sub, or_pos = self.line_or_to_subid, self.line_or_pos_topo_vect
+        ex_sub, ex_pos = self.line_ex_to_subid, self.line_ex_pos_topo_vect
+        _fill_topo_vect(self._line_from_bus_arr, or_sub[:nb], or_pos[:nb], line_status[:nb], res)
+        _fill_topo_vect(self._line_to_bus_arr, ex_sub[:nb], ex_pos[:nb], line_status[:nb], res)
+        _fill_topo_vect(self._trafo_hv_bus_arr, or_sub[nb:], or_pos[nb:], line_status[nb:], res)
+        _fill_topo_vect(self._trafo_lv_bus_arr, ex_sub[nb:], ex_pos[nb:], line_status[nb:], res)
+
+        _fill_topo_vect(self._gen_bus_arr, self.gen_to_subid, self.gen_pos_topo_vect, None, res)
+        _fill_topo_vect(self._load_bus_arr, self.load_to_subid, self.load_pos_topo_vect, None, res)
 
         if self.n_storage:
             # storage can be deactivated by the environment for backward compatibility
-            i = 0
-            for bus_id in self._grid.storage["bus"].values:
-                status = self._grid.storage["in_service"].values[i]
-                if status:
-                    res[self.storage_pos_topo_vect[i]] = (
-                        1 if bus_id == self.storage_to_subid[i] else 2
-                    )
-                else:
-                    res[self.storage_pos_topo_vect[i]] = -1
-                i += 1
+            _fill_topo_vect(
+                self._storage_bus_arr,
+                self.storage_to_subid,
+                self.storage_pos_topo_vect,
+                self._storage_in_service_arr,
+                res,
+            )
 
         return res
 
     def _gens_info(self):
-        prod_p = self.cst_1 * self._grid.res_gen["p_mw"].values.astype(dt_float)
-        prod_q = self.cst_1 * self._grid.res_gen["q_mvar"].values.astype(dt_float)
-        prod_v = (
-            self.cst_1
-            * self._grid.res_gen["vm_pu"].values.astype(dt_float)
-            * self.prod_pu_to_kv
-        )
-        prod_theta = self.cst_1 * self._grid.res_gen["va_degree"].values.astype(
-            dt_float
-        )
+        # prod_p, prod_q and prod_v are modified in place: they need their own copy (and not a view on res_gen)
+        prod_p = self._grid.res_gen["p_mw"].values.astype(dt_float)
+        prod_q = self._grid.res_gen["q_mvar"].values.astype(dt_float)
+        prod_v = self._grid.res_gen["vm_pu"].values.astype(dt_float)
+        prod_v *= self.prod_pu_to_kv
+        # the other results are only copied in the result buffers by runpf: no need to copy them here
+        prod_theta = self._grid.res_gen["va_degree"].values.astype(dt_float, copy=False)
         if self._iref_slack is not None:
             # slack bus and added generator are on same bus. I need to add power of slack bus to this one.
 
@@ -1428,94 +2013,73 @@ class PandaPowerBackend(Backend):
         return prod_p, prod_q, prod_v, prod_theta
 
     def _loads_info(self):
-        load_p = self.cst_1 * self._grid.res_load["p_mw"].values.astype(dt_float)
-        load_q = self.cst_1 * self._grid.res_load["q_mvar"].values.astype(dt_float)
-        load_v = (
-            self._grid.res_bus.loc[self._grid.load["bus"].values][
-                "vm_pu"
-            ].values.astype(dt_float)
-            * self.load_pu_to_kv
-        )
-        load_theta = self._grid.res_bus.loc[self._grid.load["bus"].values][
-            "va_degree"
-        ].values.astype(dt_float)
+        load_p = self._grid.res_load["p_mw"].values.astype(dt_float, copy=False)
+        load_q = self._grid.res_load["q_mvar"].values.astype(dt_float, copy=False)
+        res_bus = self._grid.res_bus.loc[self._load_bus_arr]
+        load_v = res_bus["vm_pu"].values.astype(dt_float, copy=False) * self.load_pu_to_kv
+        load_theta = res_bus["va_degree"].values.astype(dt_float, copy=False)
         return load_p, load_q, load_v, load_theta
 
     def generators_info(self):
+        # a copy is returned, because some callers (eg the _ObsEnv) keep these vectors
         return (
-            self.cst_1 * self.prod_p,
-            self.cst_1 * self.prod_q,
-            self.cst_1 * self.prod_v,
+            self.prod_p.copy(),
+            self.prod_q.copy(),
+            self.prod_v.copy(),
         )
 
     def loads_info(self):
         return (
-            self.cst_1 * self.load_p,
-            self.cst_1 * self.load_q,
-            self.cst_1 * self.load_v,
+            self.load_p.copy(),
+            self.load_q.copy(),
+            self.load_v.copy(),
         )
 
     def lines_or_info(self):
         return (
-            self.cst_1 * self.p_or,
-            self.cst_1 * self.q_or,
-            self.cst_1 * self.v_or,
-            self.cst_1 * self.a_or,
+            self.p_or.copy(),
+            self.q_or.copy(),
+            self.v_or.copy(),
+            self.a_or.copy(),
         )
 
     def lines_ex_info(self):
         return (
-            self.cst_1 * self.p_ex,
-            self.cst_1 * self.q_ex,
-            self.cst_1 * self.v_ex,
-            self.cst_1 * self.a_ex,
+            self.p_ex.copy(),
+            self.q_ex.copy(),
+            self.v_ex.copy(),
+            self.a_ex.copy(),
         )
 
     def shunt_info(self):
-        shunt_p = self.cst_1 * self._grid.res_shunt["p_mw"].values.astype(dt_float)
-        shunt_q = self.cst_1 * self._grid.res_shunt["q_mvar"].values.astype(dt_float)
-        shunt_v = (
-            self._grid.res_bus["vm_pu"]
-            .loc[self._grid.shunt["bus"].values]
-            .values.astype(dt_float)
-        )
-        shunt_v *= (
-            self._grid.bus["vn_kv"]
-            .loc[self._grid.shunt["bus"].values]
-            .values.astype(dt_float)
-        )
-        shunt_bus = self._grid.shunt["bus"].values < self.__nb_bus_before
-        shunt_bus = 1 * shunt_bus
-        shunt_bus = shunt_bus.astype(dt_int)
-        shunt_v[~self._grid.shunt["in_service"].values] = -1.0
-        shunt_bus[~self._grid.shunt["in_service"].values] = -1
+        shunt_p = self._grid.res_shunt["p_mw"].values.astype(dt_float)
+        shunt_q = self._grid.res_shunt["q_mvar"].values.astype(dt_float)
+        # position (in the bus tables) of the bus of each shunt
+        shunt_bus_pos = self._active_bus_pos.ravel()[self._shunt_bus_arr]
+        # fancy indexing already returns a new array
+        shunt_v = self._grid.res_bus["vm_pu"].values[shunt_bus_pos].astype(dt_float, copy=False)
+        shunt_v *= self._bus_vn_kv_arr[shunt_bus_pos].astype(dt_float, copy=False)
+        shunt_bus = (self._shunt_bus_arr < self.__nb_bus_before).astype(dt_int)
+        shunt_v[~self._shunt_in_service_arr] = -1.0
+        shunt_bus[~self._shunt_in_service_arr] = -1
         return shunt_p, shunt_q, shunt_v, shunt_bus
 
     def storages_info(self):
         return (
-            self.cst_1 * self.storage_p,
-            self.cst_1 * self.storage_q,
-            self.cst_1 * self.storage_v,
+            self.storage_p.copy(),
+            self.storage_q.copy(),
+            self.storage_v.copy(),
         )
 
     def _storages_info(self):
         if self.n_storage:
             # this is because we support "backward comaptibility" feature. So the storage can be
             # deactivated from the Environment...
-            p_storage = self._grid.res_storage["p_mw"].values.astype(dt_float)
-            q_storage = self._grid.res_storage["q_mvar"].values.astype(dt_float)
-            v_storage = (
-                self._grid.res_bus.loc[self._grid.storage["bus"].values][
-                    "vm_pu"
-                ].values.astype(dt_float)
-                * self.storage_pu_to_kv
-            )
-            theta_storage = (
-                self._grid.res_bus.loc[self._grid.storage["bus"].values][
-                    "vm_pu"
-                ].values.astype(dt_float)
-                * self.storage_pu_to_kv
-            )
+            p_storage = self._grid.res_storage["p_mw"].values.astype(dt_float, copy=False)
+            q_storage = self._grid.res_storage["q_mvar"].values.astype(dt_float, copy=False)
+            res_bus = self._grid.res_bus.loc[self._storage_bus_arr]
+            v_storage = res_bus["vm_pu"].values.astype(dt_float, copy=False) * self.storage_pu_to_kv
+            theta_storage = res_bus["vm_pu"].values.astype(dt_float, copy=False) * self.storage_pu_to_kv
         else:
             p_storage = np.zeros(shape=0, dtype=dt_float)
             q_storage = np.zeros(shape=0, dtype=dt_float)
@@ -608,7 +608,7 @@ class _ObsEnv(BaseEnv):
 
         self._load_p, self._load_q, self._load_v = real_backend.loads_info()
         self._prod_p, self._prod_q, self._prod_v = real_backend.generators_info()
-        self._topo_vect = real_backend.get_topo_vect()
+        self._topo_vect = real_backend.get_topo_vect().copy()  # the backend returns a read only view
 
         # convert line status to -1 / 1 instead of false / true
         self._line_status_orig[:] = env.get_current_line_status().astype(
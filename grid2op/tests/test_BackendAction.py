@@ -50,11 +50,11 @@ class TestSuitePandaPowerBackend(PandaPowerBackend):
             shunts__,
         ) = backendAction()
 
-        tmp_prod_p = self._get_vector_inj["prod_p"](self._grid)
+        tmp_prod_p = self._grid.gen["p_mw"]
         if np.any(prod_p.changed):
             tmp_prod_p.iloc[prod_p.changed] = prod_p.values[prod_p.changed]
 
-        tmp_prod_v = self._get_vector_inj["prod_v"](self._grid)
+        tmp_prod_v = self._grid.gen["vm_pu"]
         if np.any(prod_v.changed):
             tmp_prod_v.iloc[prod_v.changed] = (
                 prod_v.values[prod_v.changed] / self.prod_pu_to_kv[prod_v.changed]
@@ -64,11 +64,11 @@ class TestSuitePandaPowerBackend(PandaPowerBackend):
             # handling of the slack bus, where "2" generators are present.
             self._grid["ext_grid"]["vm_pu"] = 1.0 * tmp_prod_v[self._id_bus_added]
 
-        tmp_load_p = self._get_vector_inj["load_p"](self._grid)
+        tmp_load_p = self._grid.load["p_mw"]
         if np.any(load_p.changed):
             tmp_load_p.iloc[load_p.changed] = load_p.values[load_p.changed]
 
-        tmp_load_q = self._get_vector_inj["load_q"](self._grid)
+        tmp_load_q = self._grid.load["q_mvar"]
         if np.any(load_q.changed):
             tmp_load_q.iloc[load_q.changed] = load_q.values[load_q.changed]
 
@@ -176,6 +176,9 @@ class TestSuitePandaPowerBackend(PandaPowerBackend):
             bus_is[i] = bus1_status  # no iloc for bus, don't ask me why please :-/
             bus_is[i + self._nb_bus_before_for_test] = bus2_status
 
+        # the grid has been modified without the methods of PandaPowerBackend
+        self._invalidate_cache()
+
 
 class TestXXXBus(unittest.TestCase):
     def setUp(self) -> None:
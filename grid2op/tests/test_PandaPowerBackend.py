@@ -5,12 +5,22 @@
 # you can obtain one at http://mozilla.org/MPL/2.0/.
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+import copy
+import importlib
+import os
+import tempfile
 import unittest
 import warnings
 
 import numpy as np
+import pandas as pd
+import pandapower as pp
 
 from grid2op import make
+from grid2op.Action import CompleteAction
+from grid2op.Rules import AlwaysLegal
+from grid2op.dtypes import dt_int
+from grid2op.Exceptions import BackendError
 
 from grid2op.tests.helper_path_test import PATH_DATA_TEST_PP, PATH_DATA_TEST
 from grid2op.Backend import PandaPowerBackend
@@ -237,6 +247,551 @@ class TestChangeBusAffectRightBus2(unittest.TestCase):
         assert np.sum(env.backend._grid["bus"]["in_service"]) == 14
         assert env.backend._grid["trafo"]["hv_bus"][2] == 4
 
+    def test_set_bus_shunt(self):
+        self.skip_if_needed()
+        backend = self.make_backend()
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = make(
+                "rte_case14_realistic",
+                test=True,
+                action_class=CompleteAction,
+                gamerules_class=AlwaysLegal,
+                backend=backend,
+            )
+            sub_id = env.backend.shunt_to_subid[0]
+            action = env.action_space({"shunt": {"set_bus": [(0, 2)]}})
+            env.step(action)
+        assert env.backend._grid["shunt"]["bus"].iloc[0] == sub_id + env.n_sub
+        assert env.backend._grid["shunt"]["in_service"].iloc[0]
+
+
+class MakeBackendCase14:
+    """create a PandaPowerBackend (or a subclass of it) with the grid "test_case14.json" loaded"""
+
+    def make_backend(self, backend_cls=PandaPowerBackend, **kwargs):
+        backend = backend_cls(**kwargs)
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            backend.load_grid(PATH_DATA_TEST_PP, "test_case14.json")
+        return backend
+
+
+class TestResetRestoresGrid(MakeBackendCase14, unittest.TestCase):
+    def setUp(self):
+        self.backend = self.make_backend()
+        self.init_grid = copy.deepcopy(self.backend._grid)
+        self.init_topo_vect = self.backend.get_topo_vect().copy()
+
+    def _modify_and_reset(self):
+        self.backend._disconnect_line(3)
+        self.backend._grid.load["p_mw"] *= 1.1
+        self.backend._grid.gen["bus"].values[0] += self.backend.n_sub
+        self.backend.runpf()
+        self.backend.reset(None)
+
+    def _check_grid(self):
+        for key, val in self.init_grid.items():
+            if isinstance(val, pd.DataFrame):
+                pd.testing.assert_frame_equal(self.backend._grid[key], val)
+        assert np.array_equal(self.backend.get_topo_vect(), self.init_topo_vect)
+        assert np.array_equal(self.backend.get_line_status(), self.backend._get_line_status())
+
+    def test_reset_inplace(self):
+        line_arr = self.backend._grid.line["in_service"].values
+        self._modify_and_reset()
+        self._check_grid()
+        # the tables are not re created
+        assert np.shares_memory(line_arr, self.backend._grid.line["in_service"].values)
+
+    def test_reset_rebuild(self):
+        self.backend._reset_inplace = False
+        self._modify_and_reset()
+        self._check_grid()
+
+    def test_copy_shares_snapshot(self):
+        backend_cpy = self.backend.copy()
+        assert backend_cpy._grid_snapshot is self.backend._grid_snapshot
+        backend_cpy._reset_inplace = False
+        backend_cpy._disconnect_line(3)
+        backend_cpy.reset(None)
+        # the tables rebuilt from the snapshot can be modified
+        backend_cpy._disconnect_line(3)
+        assert not backend_cpy._grid.line["in_service"].iloc[3]
+        self._modify_and_reset()
+        self._check_grid()
+
+    def test_disconnected_load_gen_bus(self):
+        self.backend._apply_load_bus(np.array([-1]), np.array([0]), np.array([0]))
+        self.backend._apply_gen_bus(np.array([-1]), np.array([1]), np.array([0]))
+        assert self.backend._grid.load["bus"].iloc[0] == -1
+        assert not self.backend._grid.load["in_service"].iloc[0]
+        assert self.backend._grid.gen["bus"].iloc[1] == -1
+        assert not self.backend._grid.gen["in_service"].iloc[1]
+        self.backend.reset(None)
+        self._check_grid()
+
+    def test_reset_inplace_values_copied(self):
+        class CopyFrame(pd.DataFrame):
+            # the columns are given as copies: writing in their values does not modify the table
+            def __getitem__(self, key):
+                return super().__getitem__(key).copy()
+
+        self.backend._grid.line["r_ohm_per_km"] *= 2.0
+        self.backend._grid["line"] = CopyFrame(self.backend._grid.line)
+        self.backend._restore_grid(self.backend._grid_snapshot)
+        pd.testing.assert_series_equal(
+            self.backend._grid.line["r_ohm_per_km"], self.init_grid.line["r_ohm_per_km"]
+        )
+
+
+class TestCopyGrid(MakeBackendCase14, unittest.TestCase):
+    def test_copy_grid(self):
+        backend = self.make_backend()
+        backend.runpf()
+        grid_cpy = PandaPowerBackend._copy_grid(backend._grid)
+        assert type(grid_cpy) is type(backend._grid)
+        assert grid_cpy.keys() == backend._grid.keys()
+        for key, val in backend._grid.items():
+            if isinstance(val, pd.DataFrame):
+                pd.testing.assert_frame_equal(grid_cpy[key], val)
+        # the copy is independant of the original grid
+        grid_cpy.line["in_service"].values[0] = False
+        assert backend._grid.line["in_service"].values[0]
+        grid_cpy["_ppc"]["gen"][0, 1] += 1.0
+        assert grid_cpy["_ppc"]["gen"][0, 1] != backend._grid["_ppc"]["gen"][0, 1]
+
+
+class TestSaveFileFast(MakeBackendCase14, unittest.TestCase):
+    def test_save_load_fast(self):
+        backend = self.make_backend()
+        backend.runpf()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            full_path = os.path.join(tmpdir, "grid.pickle")
+            backend.save_file_fast(full_path)
+            grid = PandaPowerBackend.load_file_fast(full_path)
+        assert type(grid) is type(backend._grid)
+        assert grid.keys() == backend._grid.keys()
+        for key, val in backend._grid.items():
+            if isinstance(val, pd.DataFrame):
+                pd.testing.assert_frame_equal(grid[key], val)
+
+
+class TestRunpfBatch(MakeBackendCase14, unittest.TestCase):
+    def test_runpf_batch(self):
+        backend = self.make_backend()
+        backend.runpf()
+        p_or_init = backend.p_or.copy()
+        load_p_init = backend._load_p_arr.copy()
+        injections = [
+            {"load_p": load_p_init * coeff, "load_q": backend._load_q_arr * coeff}
+            for coeff in [0.9, 1.0, 1.1]
+        ]
+        injections.append({"prod_p": backend._gen_p_arr * 1.05})
+        res_seq = backend.runpf_batch(injections, nb_process=1)
+        res_par = backend.runpf_batch(injections, nb_process=2)
+        assert len(res_seq) == len(injections)
+        assert len(res_par) == len(injections)
+        for el_seq, el_par in zip(res_seq, res_par):
+            assert el_seq[0] and el_par[0]
+            assert el_seq[1] is None and el_par[1] is None
+            assert len(el_par) == 16
+            for arr_seq, arr_par in zip(el_seq[2:], el_par[2:]):
+                assert np.allclose(arr_seq, arr_par)
+        # the loads are taken into account, and "missing" injections keep their initial values
+        assert np.allclose(res_par[0][5], load_p_init * 0.9)
+        assert np.allclose(res_par[1][8], p_or_init)
+        assert np.allclose(res_par[3][5], load_p_init)
+        assert not np.allclose(res_par[2][8], res_par[1][8])
+        # the backend itself is not modified
+        assert np.array_equal(backend._load_p_arr, load_p_init)
+        assert np.array_equal(backend.p_or, p_or_init)
+
+    def test_runpf_batch_nb_process(self):
+        for recycle in [False, True]:
+            backend = self.make_backend(recycle=recycle)
+            backend.runpf()
+            load_p_init = backend._load_p_arr.copy()
+            # the first scenario diverges, it must not impact the other ones
+            injections = [{"load_p": load_p_init * 100.0}]
+            injections += [{"load_p": load_p_init * coeff} for coeff in [0.9, 1.1, 0.95, 1.05, 1.0]]
+            all_res = [backend.runpf_batch(injections, nb_process=nb_process) for nb_process in [1, 2, 3]]
+            assert not all_res[0][0][0]
+            for res in all_res[1:]:
+                for el_ref, el in zip(all_res[0], res):
+                    assert el_ref[0] == el[0]
+                    for arr_ref, arr in zip(el_ref[2:], el[2:]):
+                        assert np.array_equal(arr_ref, arr, equal_nan=True)
+
+
+class TestApplyTopoScatter(MakeBackendCase14, unittest.TestCase):
+    def setUp(self):
+        self.backend = self.make_backend()
+
+    def test_translate_bus(self):
+        init_bus = np.array([3, 4, 5], dtype=dt_int)
+        res = self.backend._pp_bus_from_grid2op_bus(
+            np.array([1, 2, -1], dtype=dt_int), init_bus
+        )
+        assert np.array_equal(res, [3, 4 + self.backend.n_sub, -1])
+        with self.assertRaises(BackendError):
+            self.backend._pp_bus_from_grid2op_bus(
+                np.array([1, 3, -1], dtype=dt_int), init_bus
+            )
+
+    def test_apply_lines(self):
+        id_lines = np.array([0, 2], dtype=dt_int)
+        self.backend._apply_lor_bus(np.array([2, -1], dtype=dt_int), id_lines, id_lines)
+        from_bus = self.backend._grid.line["from_bus"].values
+        in_service = self.backend._grid.line["in_service"].values
+        assert from_bus[0] == self.backend.line_or_to_subid[0] + self.backend.n_sub
+        assert in_service[0]
+        # the bus of a disconnected powerline is not modified
+        assert from_bus[2] == self.backend.line_or_to_subid[2]
+        assert not in_service[2]
+        with self.assertRaises(BackendError):
+            self.backend._apply_lor_bus(np.array([0], dtype=dt_int), id_lines[:1], id_lines[:1])
+
+    def test_change_bus_powerline(self):
+        nb_sub = self.backend.n_sub
+        # scalar
+        self.backend.change_bus_powerline_or(3, 5 + nb_sub)
+        self.backend.change_bus_trafo_lv(0, -1)
+        assert self.backend._grid.line["from_bus"].values[3] == 5 + nb_sub
+        assert self.backend._grid.line["in_service"].values[3]
+        assert not self.backend._grid.trafo["in_service"].values[0]
+        # vectors
+        self.backend.change_bus_powerline_ex(np.array([0, 1]), np.array([-1, 2 + nb_sub]))
+        assert not self.backend._grid.line["in_service"].values[0]
+        assert self.backend._grid.line["to_bus"].values[1] == 2 + nb_sub
+        assert self.backend._topo_dirty
+
+    def test_topo_vect_updated(self):
+        assert not self.backend._topo_dirty
+        id_lines = np.array([2], dtype=dt_int)
+        self.backend._apply_lor_bus(np.array([-1], dtype=dt_int), id_lines, id_lines)
+        assert self.backend._topo_dirty
+        conv, _ = self.backend.runpf()
+        assert conv
+        assert not self.backend._topo_dirty
+        topo_vect = self.backend.get_topo_vect()
+        assert topo_vect[self.backend.line_or_pos_topo_vect[2]] == -1
+        assert topo_vect[self.backend.line_ex_pos_topo_vect[2]] == -1
+        self.backend._reconnect_line(2)
+        assert self.backend._topo_dirty
+        conv, _ = self.backend.runpf()
+        assert conv
+        assert np.all(self.backend.get_topo_vect() == 1)
+
+
+class TestGridModifiedDirectly(MakeBackendCase14, unittest.TestCase):
+    def setUp(self):
+        self.backend = self.make_backend()
+        conv, _ = self.backend.runpf()
+        assert conv
+
+    def _check_line_0_disconnected(self):
+        conv, _ = self.backend.runpf()
+        assert conv
+        assert not self.backend.get_line_status()[0]
+        assert self.backend.get_topo_vect()[self.backend.line_or_pos_topo_vect[0]] == -1
+        assert self.backend.p_or[0] == 0.0
+
+    def test_invalidate_cache(self):
+        self.backend._grid.line["in_service"].values[0] = False
+        self.backend._invalidate_cache()
+        assert self.backend._topo_dirty
+        self._check_line_0_disconnected()
+
+    def test_column_replaced(self):
+        # the cached arrays do not share memory with the grid anymore, this is detected
+        in_service = self.backend._grid.line["in_service"].values.copy()
+        in_service[0] = False
+        self.backend._grid.line["in_service"] = in_service
+        assert not self.backend._aux_cached_arrays_valid()
+        self._check_line_0_disconnected()
+        assert self.backend._aux_cached_arrays_valid()
+
+
+class TestKernels(MakeBackendCase14, unittest.TestCase):
+    """the loop versions (compiled with numba when available) and the numpy versions give the same results"""
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.nb_el = 20
+
+    def test_translate_bus(self):
+        from grid2op.Backend.PandaPowerBackend import _translate_bus_loop, _translate_bus_numpy
+
+        new_bus = self.rng.choice([-1, 1, 2, 0, 3], size=self.nb_el).astype(dt_int)
+        init_bus = self.rng.integers(0, 14, size=self.nb_el)
+        res_loop = _translate_bus_loop(new_bus, init_bus, 14)
+        res_numpy = _translate_bus_numpy(new_bus, init_bus, 14)
+        assert res_loop.dtype == res_numpy.dtype
+        assert np.array_equal(res_loop, res_numpy)
+
+    def test_apply_topo_scatter(self):
+        from grid2op.Backend.PandaPowerBackend import _apply_topo_scatter_loop, _apply_topo_scatter_numpy
+
+        init_bus = self.rng.integers(0, 14, size=self.nb_el)
+        for set_bus_disconnected in [True, False]:
+            new_bus = self.rng.choice([-1, 1, 2], size=self.nb_el // 2).astype(dt_int)
+            id_init = self.rng.permutation(self.nb_el)[: self.nb_el // 2].astype(dt_int)
+            id_out = self.rng.permutation(self.nb_el)[: self.nb_el // 2].astype(dt_int)
+            res = []
+            for fun_ in [_apply_topo_scatter_loop, _apply_topo_scatter_numpy]:
+                out_bus = init_bus.copy()
+                out_in_service = np.ones(self.nb_el, dtype=bool)
+                ok = fun_(new_bus, id_init, id_out, init_bus, 14, out_bus, out_in_service, set_bus_disconnected)
+                assert ok
+                res.append((out_bus, out_in_service))
+            assert np.array_equal(res[0][0], res[1][0])
+            assert np.array_equal(res[0][1], res[1][1])
+            # invalid buses are detected by both
+            new_bus[0] = 3
+            for fun_ in [_apply_topo_scatter_loop, _apply_topo_scatter_numpy]:
+                out_bus = init_bus.copy()
+                out_in_service = np.ones(self.nb_el, dtype=bool)
+                assert not fun_(new_bus, id_init, id_out, init_bus, 14, out_bus, out_in_service, set_bus_disconnected)
+
+    def test_clean_flows(self):
+        from grid2op.Backend.PandaPowerBackend import _clean_flows_loop, _clean_flows_numpy
+
+        a = self.rng.uniform(size=self.nb_el).astype(np.float32)
+        v = self.rng.uniform(size=self.nb_el).astype(np.float32)
+        a[[0, 3]] = [np.NaN, np.Inf]
+        v[[1, 4]] = np.NaN
+        line_status = self.rng.uniform(size=self.nb_el) > 0.3
+        v_pu_to_kv = self.rng.uniform(100.0, 400.0, size=self.nb_el).astype(np.float32)
+        res = []
+        for fun_ in [_clean_flows_loop, _clean_flows_numpy]:
+            a_ = a.copy()
+            v_ = v.copy()
+            fun_(a_, v_, line_status, v_pu_to_kv)
+            res.append((a_, v_))
+        assert np.array_equal(res[0][0], res[1][0])
+        assert np.array_equal(res[0][1], res[1][1])
+        assert np.all(np.isfinite(res[0][1]))
+
+    def test_fill_topo_vect(self):
+        from grid2op.Backend.PandaPowerBackend import _fill_topo_vect_loop, _fill_topo_vect_numpy
+
+        subid = self.rng.integers(0, 14, size=self.nb_el)
+        bus = subid + 14 * self.rng.integers(0, 2, size=self.nb_el)
+        pos = self.rng.permutation(2 * self.nb_el)[: self.nb_el]
+        status = self.rng.uniform(size=self.nb_el) > 0.3
+        for status_ in [None, status]:
+            res = []
+            for fun_ in [_fill_topo_vect_loop, _fill_topo_vect_numpy]:
+                topo_vect = np.zeros(2 * self.nb_el, dtype=dt_int)
+                fun_(bus, subid, pos, status_, topo_vect)
+                res.append(topo_vect)
+            assert np.array_equal(res[0], res[1])
+
+    def test_numba_warm_up(self):
+        # the compilation of the numba functions in load_grid does not mark the topology as modified
+        # (the module, and not the class of the same name exported by grid2op.Backend)
+        ppb_module = importlib.import_module("grid2op.Backend.PandaPowerBackend")
+
+        numba_ = ppb_module.numba_
+        try:
+            ppb_module.numba_ = True  # the warm up also runs with the numpy implementations
+            backend = self.make_backend()
+        finally:
+            ppb_module.numba_ = numba_
+        assert not backend._topo_dirty
+        assert np.all(backend.get_topo_vect() == 1)
+
+
+class TestSolverOptions(MakeBackendCase14, unittest.TestCase):
+    def test_default_lightsim2grid(self):
+        # lightsim2grid is only used when explicitly asked for
+        assert not PandaPowerBackend()._ligthsim2grid
+        assert PandaPowerBackend(ligthsim2grid=True)._ligthsim2grid
+
+    def test_copy_keeps_options(self):
+        backend = self.make_backend(ligthsim2grid=False, dist_slack=True, max_iter=7)
+        backend_cpy = backend.copy()
+        assert not backend_cpy._ligthsim2grid
+        assert backend_cpy._dist_slack
+        assert backend_cpy._max_iter == 7
+
+    def test_sparse_solver_options(self):
+        backend = self.make_backend(use_umfpack=False, permc_spec="MMD_AT_PLUS_A")
+        conv, _ = backend.runpf()
+        assert conv
+        backend_cpy = backend.copy()
+        assert not backend_cpy._use_umfpack
+        assert backend_cpy._permc_spec == "MMD_AT_PLUS_A"
+        # only the non default options are used when the backend is re created
+        assert backend._my_kwargs["use_umfpack"] is False
+        assert backend._my_kwargs["permc_spec"] == "MMD_AT_PLUS_A"
+        assert "use_umfpack" not in PandaPowerBackend()._my_kwargs
+
+    def test_recycle(self):
+        backends = [self.make_backend(recycle=True), self.make_backend(recycle=False)]
+        for backend in backends:
+            conv, _ = backend.runpf()
+            assert conv
+        assert not backends[0].copy()._ybus_dirty
+        assert not backends[1].copy()._recycle
+        # recycling is opt-in
+        assert not PandaPowerBackend()._recycle
+        assert backends[0]._my_kwargs["recycle"] is True
+        assert "recycle" not in backends[1]._my_kwargs
+        for modif in ["load", "load", "line", "load"]:
+            for backend in backends:
+                if modif == "load":
+                    backend._load_p_arr[:] *= 1.02
+                    assert not backend._ybus_dirty
+                else:
+                    backend._disconnect_line(0)
+                    assert backend._ybus_dirty
+                conv, _ = backend.runpf()
+                assert conv
+            assert np.allclose(backends[0].p_or, backends[1].p_or, rtol=1e-5, atol=1e-5)
+            assert np.allclose(backends[0].v_or, backends[1].v_or, rtol=1e-5, atol=1e-5)
+        assert backends[0].p_or[0] == 0.0
+
+    def test_recycle_grid_modified_directly(self):
+        backends = [self.make_backend(recycle=True), self.make_backend(recycle=False)]
+        for backend in backends:
+            conv, _ = backend.runpf()
+            assert conv
+            # the grid is modified in place, without the methods of the backend (and without _invalidate_cache)
+            backend._grid.line["in_service"].values[0] = False
+            backend._grid.shunt["q_mvar"].values[0] *= 2.0
+            if not backend._recycle:
+                # reference: the documented way
+                backend._invalidate_cache()
+            conv, _ = backend.runpf()
+            assert conv
+        assert not backends[0].get_line_status()[0]
+        assert backends[0].get_topo_vect()[backends[0].line_or_pos_topo_vect[0]] == -1
+        assert backends[0].p_or[0] == 0.0
+        assert np.allclose(backends[0].p_or, backends[1].p_or, rtol=1e-5, atol=1e-5)
+        assert np.allclose(backends[0].v_or, backends[1].v_or, rtol=1e-5, atol=1e-5)
+
+    def test_recycle_apply_action_overridden(self):
+        class PPBackendOverride(PandaPowerBackend):
+            def apply_action(self, backendAction=None):
+                pass
+
+        backend = self.make_backend(backend_cls=PPBackendOverride, recycle=True)
+        conv, _ = backend.runpf()
+        assert conv
+        # the grid is modified directly, without the setters of the backend
+        backend._grid.line.loc[0, "in_service"] = False
+        conv, _ = backend.runpf()
+        assert conv
+        assert not backend.get_line_status()[0]
+        assert backend.get_topo_vect()[backend.line_or_pos_topo_vect[0]] == -1
+        assert backend.p_or[0] == 0.0
+
+
+class TestResultBuffer(MakeBackendCase14, unittest.TestCase):
+    def test_reset_all_nan(self):
+        backend = self.make_backend()
+        conv, _ = backend.runpf()
+        assert conv
+        for backend_ in [backend.copy(), copy.deepcopy(backend), backend]:
+            assert np.shares_memory(backend_.p_or, backend_._res_buf)
+            assert np.shares_memory(backend_.gen_theta, backend_._res_buf)
+            assert np.all(np.isfinite(backend_.p_or))
+            backend_._reset_all_nan()
+            assert np.all(np.isnan(backend_.p_or))
+            assert np.all(np.isnan(backend_.load_v))
+            assert np.all(np.isnan(backend_.gen_theta))
+
+
+class TestReadOnlyGetters(MakeBackendCase14, unittest.TestCase):
+    def test_getters_read_only(self):
+        backend = self.make_backend()
+        conv, _ = backend.runpf()
+        assert conv
+        for backend_ in [backend, backend.copy(), copy.deepcopy(backend)]:
+            for vect in [
+                backend_.get_line_status(),
+                backend_.get_line_flow(),
+                backend_.get_topo_vect(),
+            ]:
+                assert not vect.flags.writeable
+                with self.assertRaises(ValueError):
+                    vect[0] = 0
+            # the vectors returned are updated by the backend
+            line_status = backend_.get_line_status()
+            topo_vect = backend_.get_topo_vect()
+            a_or = backend_.get_line_flow()
+            backend_._disconnect_line(0)
+            conv, _ = backend_.runpf()
+            assert conv
+            assert not line_status[0]
+            assert topo_vect[backend_.line_or_pos_topo_vect[0]] == -1
+            assert a_or[0] == 0.0
+        # the copies do not share their vectors with the original backend
+        backend_cpy = backend.copy()
+        assert not np.shares_memory(backend.get_line_status(), backend_cpy.get_line_status())
+        assert not np.shares_memory(backend.get_line_flow(), backend_cpy.get_line_flow())
+        assert not np.shares_memory(backend.get_topo_vect(), backend_cpy.get_topo_vect())
+
+
+class TestShuntInfo(MakeBackendCase14, unittest.TestCase):
+    def test_shunt_v(self):
+        # the buses of this grid are not sorted in the bus table
+        backend = self.make_backend()
+        conv, _ = backend.runpf()
+        assert conv
+        grid = backend._grid
+        sh_bus = grid.shunt["bus"].values
+        shunt_v_ref = (
+            grid.res_bus["vm_pu"].loc[sh_bus].values * grid.bus["vn_kv"].loc[sh_bus].values
+        )
+        _, _, shunt_v, shunt_bus = backend.shunt_info()
+        assert np.allclose(shunt_v, shunt_v_ref)
+        assert np.all(shunt_bus == 1)
+
+
+class TestDCLoadVoltage(MakeBackendCase14, unittest.TestCase):
+    def test_load_v_dc(self):
+        backend = self.make_backend()
+        conv, _ = backend.runpf(is_dc=True)
+        assert conv
+        for l_id in range(backend.n_load):
+            gen_ids = np.flatnonzero(backend.gen_to_subid == backend.load_to_subid[l_id])
+            if gen_ids.shape[0]:
+                # loads are given the voltage of the generator at the same bus
+                assert backend.load_v[l_id] == backend.prod_v[gen_ids[0]]
+            else:
+                assert backend.load_v[l_id] == backend.load_pu_to_kv[l_id]
+
+
+class TestDefaultNames(unittest.TestCase):
+    def test_make_names(self):
+        res = PandaPowerBackend._aux_make_names("load", np.array([3, 5]), np.arange(2))
+        assert np.array_equal(res, ["load_3_0", "load_5_1"])
+        res = PandaPowerBackend._aux_make_names(np.array([10, 2]), np.array([9, 4]), np.arange(2))
+        assert np.array_equal(res, ["10_9_0", "2_4_1"])
+        res = PandaPowerBackend._aux_make_names("shunt", np.zeros(0, dtype=int), np.arange(0))
+        assert res.shape == (0,)
+
+    def test_grid_without_names(self):
+        grid = pp.from_json(os.path.join(PATH_DATA_TEST_PP, "test_case14.json"))
+        for el in ["line", "trafo", "gen", "load"]:
+            grid[el]["name"] = None
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pp.to_json(grid, os.path.join(tmp_dir, "grid.json"))
+            backend = PandaPowerBackend()
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore")
+                backend.load_grid(tmp_dir, "grid.json")
+        nb_line = grid.line.shape[0]
+        assert backend.name_line[0] == "{}_{}_0".format(grid.line["from_bus"].iloc[0], grid.line["to_bus"].iloc[0])
+        hv_lv = sorted([str(grid.trafo["hv_bus"].iloc[0]), str(grid.trafo["lv_bus"].iloc[0])])
+        assert backend.name_line[nb_line] == "{}_{}_{}".format(*hv_lv, nb_line)
+        assert backend.name_gen[1] == "gen_{}_1".format(grid.gen["bus"].iloc[1])
+        assert backend.name_load[2] == "load_{}_2".format(grid.load["bus"].iloc[2])
+        assert backend.name_sub[3] == "sub_{}".format(grid.bus.index[3])
+
 
 if __name__ == "__main__":
     unittest.main()